@@ -3,25 +3,183 @@
 Manage the MCP server - start, stop, and check status.
 """
 
+import os
+import select
+import signal
 import subprocess
 import sys
 import time
 
+SERVER_MARKER = "tools/mcp_server/main.py"
 
-def get_server_pid():
-    """Get the PID of the running MCP server."""
+# argv of interest always sits in the first page of /proc/<pid>/cmdline
+CMDLINE_READ_SIZE = 4096
+
+# Environment variable naming the pipe FD the server writes READY to
+READY_FD_ENV = "MCP_READY_FD"
+READY_TIMEOUT = 2.0
+
+# Reuse a recent PID lookup so one command doesn't rescan the process table
+PID_CACHE_TTL = 0.5
+_PID_CACHE = {"ts": 0.0, "pid": None}
+
+
+def _read_cmdline(pid):
+    """Read /proc/<pid>/cmdline with a single unbuffered read."""
+    fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
+    try:
+        return os.read(fd, CMDLINE_READ_SIZE)
+    finally:
+        os.close(fd)
+
+
+def _is_server_cmdline(data):
+    """
+    Check whether a NUL-separated cmdline runs the server script.
+
+    argv[0] must be a Python interpreter and argv[1] the script, so `grep`,
+    `less` or an editor that merely has the path as an argument don't match.
+    """
+    argv = data.split(b"\0")
+    if len(argv) < 2 or not os.path.basename(argv[0]).startswith(b"python"):
+        return False
+    script = argv[1]
+    marker = SERVER_MARKER.encode()
+    return script == marker or script.endswith(b"/" + marker)
+
+
+def _find_pid_in_proc():
+    """Scan /proc/<pid>/cmdline for the server script."""
+    own_pid = str(os.getpid())
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit() or entry.name == own_pid:
+                continue
+            try:
+                data = _read_cmdline(entry.name)
+            except OSError:
+                # Process exited between listing and reading
+                continue
+            if _is_server_cmdline(data):
+                return int(entry.name)
+    return None
+
+
+def _cmdline_of(pid):
+    """NUL-separated cmdline of a process, from /proc or else from ps."""
     try:
-        result = subprocess.run(["ps", "aux"], capture_output=True, text=True)
+        return _read_cmdline(pid)
+    except OSError:
+        pass
+    result = subprocess.run(
+        ["ps", "-ww", "-o", "args=", "-p", str(pid)], capture_output=True, text=True
+    )
+    return "\0".join(result.stdout.split()).encode()
 
-        for line in result.stdout.split("\n"):
-            if "tools/mcp_server/main.py" in line and "grep" not in line:
-                parts = line.split()
-                return int(parts[1])
 
+def _find_pid_with_pgrep():
+    """Fall back to pgrep on systems without /proc (e.g. macOS)."""
+    result = subprocess.run(
+        ["pgrep", "-f", SERVER_MARKER], capture_output=True, text=True
+    )
+    if result.returncode != 0:
         return None
+
+    # pgrep -f matches the marker anywhere in the command line; keep only
+    # the processes the /proc scan would accept too
+    for line in result.stdout.split():
+        pid = int(line)
+        if pid != os.getpid() and _is_server_cmdline(_cmdline_of(pid)):
+            return pid
+    return None
+
+
+def _invalidate_pid_cache():
+    """Forget the cached PID after the server state has been changed."""
+    _PID_CACHE["ts"] = 0.0
+    _PID_CACHE["pid"] = None
+
+
+def get_server_pid():
+    """Get the PID of the running MCP server."""
+    now = time.monotonic()
+    if _PID_CACHE["ts"] and now - _PID_CACHE["ts"] < PID_CACHE_TTL:
+        return _PID_CACHE["pid"]
+
+    try:
+        if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+            pid = _find_pid_in_proc()
+        else:
+            pid = _find_pid_with_pgrep()
     except Exception:
         return None
 
+    _PID_CACHE["ts"] = now
+    _PID_CACHE["pid"] = pid
+    return pid
+
+
+def _pid_alive(pid):
+    """Return True if a process with this PID still exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _wait_exit(pid, timeout):
+    """
+    Wait up to `timeout` seconds for a process to exit.
+
+    Uses a pidfd so we wake as soon as the process is gone; falls back to
+    polling with exponential backoff where pidfd_open is unavailable.
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    if hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # Kernel without pidfd support; use the polling path below
+            pass
+        else:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(fd)
+
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while _pid_alive(pid):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.16)
+    return True
+
+
+def _wait_ready(read_fd, timeout):
+    """
+    Wait up to `timeout` seconds for the server's readiness message.
+
+    Returns:
+        True if the server reported READY, False on timeout or if the
+        pipe was closed without it (e.g. the server exited)
+    """
+    readable, _, _ = select.select([read_fd], [], [], timeout)
+    if not readable:
+        return False
+    return os.read(read_fd, 64).startswith(b"READY")
+
 
 def start_server():
     """Start the MCP server in the background."""
@@ -32,21 +190,37 @@ def start_server():
 
     print("🚀 Starting MCP server in background...")
 
+    read_fd, write_fd = os.pipe()
     try:
-        subprocess.Popen(
-            [
-                "/Users/ivaylo.kiryazov/redis-py-test-infra/.venv/bin/python",
-                "tools/mcp_server/main.py",
-                "--debug",
-            ],
-            cwd="/Users/ivaylo.kiryazov/redis-py-test-infra",
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            stdin=subprocess.DEVNULL,
-        )
-
-        # Give it a moment to start
-        time.sleep(2)
+        try:
+            subprocess.Popen(
+                [
+                    "/Users/ivaylo.kiryazov/redis-py-test-infra/.venv/bin/python",
+                    "tools/mcp_server/main.py",
+                    "--debug",
+                ],
+                cwd="/Users/ivaylo.kiryazov/redis-py-test-infra",
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                env={**os.environ, READY_FD_ENV: str(write_fd)},
+                # Own session so closing the launching terminal (SIGHUP)
+                # doesn't take the server down with it
+                start_new_session=True,
+                # Only the readiness pipe is inherited; on Python 3.9+
+                # close_fds uses close_range(2) for everything else
+                close_fds=True,
+                pass_fds=(write_fd,),
+            )
+        finally:
+            # The child holds its own copy; closing ours lets us see EOF
+            # if it exits before reporting ready
+            os.close(write_fd)
+        _invalidate_pid_cache()
+
+        # Wake as soon as the server reports ready instead of sleeping.
+        # Servers that don't signal readiness just cost the full timeout.
+        _wait_ready(read_fd, READY_TIMEOUT)
 
         # Check if it's running
         pid = get_server_pid()
@@ -60,6 +234,8 @@ def start_server():
     except Exception as e:
         print(f"❌ Error starting server: {e}")
         return False
+    finally:
+        os.close(read_fd)
 
 
 def stop_server():
@@ -73,16 +249,15 @@ def stop_server():
 
     try:
         # Try graceful shutdown first
-        subprocess.run(["kill", str(pid)], check=True)
-
-        # Wait a bit for graceful shutdown
-        time.sleep(2)
+        os.kill(pid, signal.SIGTERM)
+        _invalidate_pid_cache()
 
-        # Check if still running
-        if get_server_pid():
+        # Wait for graceful shutdown, escalating only if it doesn't happen
+        if not _wait_exit(pid, 2.0):
             print("🔨 Force killing server...")
-            subprocess.run(["kill", "-9", str(pid)], check=True)
-            time.sleep(1)
+            os.kill(pid, signal.SIGKILL)
+            _invalidate_pid_cache()
+            _wait_exit(pid, 1.0)
 
         if not get_server_pid():
             print("✅ MCP server stopped successfully")
@@ -91,6 +266,14 @@ def stop_server():
             print("❌ Failed to stop MCP server")
             return False
 
+    except ProcessLookupError:
+        # Process exited before we could signal it
+        _invalidate_pid_cache()
+        print("✅ MCP server stopped successfully")
+        return True
+    except PermissionError:
+        print(f"❌ Permission denied stopping server (PID: {pid})")
+        return False
     except Exception as e:
         print(f"❌ Error stopping server: {e}")
         return False
@@ -6,22 +6,27 @@ This script provides a convenient way to launch the MCP server with various opti
 """
 
 import argparse
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
 
 
+def _have_mcp():
+    """Check whether the MCP SDK is importable without importing it."""
+    # The launcher never uses mcp itself; only the server subprocess does
+    return importlib.util.find_spec("mcp") is not None
+
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import mcp  # noqa: F401
-
+    if _have_mcp():
         print("✓ MCP SDK installed")
         return True
-    except ImportError:
-        print("✗ MCP SDK not found. Please install dependencies:")
-        print("  cd tools/mcp_server && pip install -r requirements.txt")
-        return False
+
+    print("✗ MCP SDK not found. Please install dependencies:")
+    print("  cd tools/mcp_server && pip install -r requirements.txt")
+    return False
 
 
 def run_server(debug=False, max_file_size=None, max_depth=None, test_mode=False):
@@ -6,6 +6,7 @@ This script provides an easy way to run all tests with various options.
 """
 
 import argparse
+import importlib.util
 import os
 import subprocess
 import sys
@@ -21,14 +22,14 @@ def run_tests(
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
 
-    # Build pytest command
-    cmd = ["python", "-m", "pytest"]
+    # Build pytest arguments
+    pytest_args = []
 
     # Add test paths based on test type
     if test_type == "all":
-        cmd.append("tests/")
+        pytest_args.append("tests/")
     elif test_type == "unit":
-        cmd.extend(
+        pytest_args.extend(
             [
                 "tests/test_config.py",
                 "tests/test_ast_parsing.py",
@@ -38,21 +39,21 @@ def run_tests(
             ]
         )
     elif test_type == "integration":
-        cmd.append("tests/test_integration.py")
+        pytest_args.append("tests/test_integration.py")
     elif test_type == "server":
-        cmd.append("tests/test_server_tools.py")
+        pytest_args.append("tests/test_server_tools.py")
     else:
-        cmd.append(f"tests/test_{test_type}.py")
+        pytest_args.append(f"tests/test_{test_type}.py")
 
     # Add verbosity
     if verbose:
-        cmd.append("-v")
+        pytest_args.append("-v")
     else:
-        cmd.append("-q")
+        pytest_args.append("-q")
 
     # Add coverage
     if coverage:
-        cmd.extend(
+        pytest_args.extend(
             [
                 "--cov=config",
                 "--cov=main",
@@ -63,33 +64,51 @@ def run_tests(
         )
 
     # Add parallel execution
+    use_xdist = False
     if parallel:
         try:
             import pytest_xdist  # noqa: F401
 
-            cmd.extend(["-n", "auto"])
+            pytest_args.extend(["-n", "auto"])
+            use_xdist = True
         except ImportError:
             print("Warning: pytest-xdist not installed, running tests sequentially")
 
     # Add marker filtering
     if marker:
-        cmd.extend(["-m", marker])
+        pytest_args.extend(["-m", marker])
 
     # Add additional options
-    cmd.extend(
+    pytest_args.extend(
         [
             "--tb=short",
             "--strict-markers",
         ]
     )
 
-    print(f"Running command: {' '.join(cmd)}")
+    print(f"Running command: python -m pytest {' '.join(pytest_args)}")
     print("=" * 60)
 
     # Run the tests
     try:
-        result = subprocess.run(cmd, check=False)
-        return result.returncode
+        if use_xdist:
+            # xdist spawns its own workers, keep pytest in a child process
+            cmd = [sys.executable, "-m", "pytest"] + pytest_args
+            result = subprocess.run(cmd, check=False)
+            return result.returncode
+
+        # Run in-process to avoid a second interpreter start-up
+        try:
+            import pytest
+        except ImportError:
+            print("Error running tests: pytest is not installed")
+            print("Use --install-deps to install missing dependencies")
+            return 1
+
+        try:
+            return int(pytest.main(pytest_args))
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1
     except KeyboardInterrupt:
         print("\n\nTests interrupted by user")
         return 130
@@ -105,33 +124,34 @@ def check_test_dependencies():
 
     missing_required = []
     missing_optional = []
+    # Collect the report and write it in one go
+    lines = []
 
+    # find_spec locates the module without executing it
     for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-            print(f"✓ {package} is installed")
-        except ImportError:
+        if importlib.util.find_spec(package.replace("-", "_")) is not None:
+            lines.append(f"✓ {package} is installed")
+        else:
             missing_required.append(package)
-            print(f"✗ {package} is missing")
+            lines.append(f"✗ {package} is missing")
 
     for package in optional_packages:
-        try:
-            __import__(package.replace("-", "_"))
-            print(f"✓ {package} is installed (optional)")
-        except ImportError:
+        if importlib.util.find_spec(package.replace("-", "_")) is not None:
+            lines.append(f"✓ {package} is installed (optional)")
+        else:
             missing_optional.append(package)
-            print(f"○ {package} is missing (optional)")
+            lines.append(f"○ {package} is missing (optional)")
 
     if missing_required:
-        print(f"\nMissing required packages: {', '.join(missing_required)}")
-        print("Install with: pip install -r requirements.txt")
-        return False
+        lines.append(f"\nMissing required packages: {', '.join(missing_required)}")
+        lines.append("Install with: pip install -r requirements.txt")
 
     if missing_optional:
-        print(f"\nMissing optional packages: {', '.join(missing_optional)}")
-        print("Install with: pip install pytest-xdist")
+        lines.append(f"\nMissing optional packages: {', '.join(missing_optional)}")
+        lines.append("Install with: pip install pytest-xdist")
 
-    return True
+    sys.stdout.write("\n".join(lines) + "\n")
+    return not missing_required
 
 
 def main():
@@ -220,11 +240,8 @@ Examples:
             print(f"✗ Failed to install dependencies: {e}")
             return 1
 
-    # Check dependencies before running tests
-    if not check_test_dependencies():
-        print("\nUse --install-deps to install missing dependencies")
-        return 1
-
+    # No pre-flight dependency check here: a missing pytest or plugin is
+    # reported by pytest itself, and --check-deps remains for diagnostics
     print("\n" + "=" * 60)
     print("Redis-py MCP Server - Test Suite")
     print("=" * 60)
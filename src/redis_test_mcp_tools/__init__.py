@@ -10,6 +10,14 @@ __author__ = "Redis Team"
 __email__ = "redis-team@example.com"
 
 from .config import config
-from .main import server
 
 __all__ = ["server", "config"]
+
+
+def __getattr__(name):
+    # Import the server (and the MCP SDK) only when it is actually requested
+    if name == "server":
+        from .server import server
+
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,34 @@
 Configuration settings for the Redis-py MCP Server
 """
 
+import functools
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, FrozenSet, Pattern
+
+
+@functools.lru_cache(maxsize=8)
+def _ignored_component_re(ignore_dirs: FrozenSet[str]) -> Pattern[str]:
+    """
+    Compile one regex matching any ignored component of a path string.
+
+    A component is ignored when it is one of ignore_dirs or is hidden (starts
+    with a dot but is not '.' or '..'), the same rules as is_ignored_component.
+    """
+    sep = re.escape(os.sep)
+    alternatives = [re.escape(name) for name in sorted(ignore_dirs)]
+    alternatives.append(rf"\.(?!\.?(?:{sep}|$))[^{sep}]*")
+    return re.compile(rf"(?:^|{sep})(?:{'|'.join(alternatives)})(?:{sep}|$)")
 
 
 class MCPServerConfig:
     """Configuration class for the MCP server."""
 
+    # Accepted spellings for boolean environment variables
+    _TRUE_VALUES = frozenset({"true", "1", "yes", "on", "enabled"})
+    _FALSE_VALUES = frozenset({"false", "0", "no", "off", "disabled", ""})
+
     def __init__(self):
         self.project_root = Path(__file__).parent.parent.parent
         self.server_name = "redis-py-test-infra"
@@ -31,37 +51,55 @@ class MCPServerConfig:
         }
 
         # Directories to ignore
-        self.ignore_dirs = {
-            ".git",
-            ".venv",
-            "venv",
-            "__pycache__",
-            ".pytest_cache",
-            "node_modules",
-            ".tox",
-            "build",
-            "dist",
-            ".eggs",
-            "env",
-            ".coverage",
-            ".mypy_cache",
-            ".ruff_cache",
-        }
+        self.ignore_dirs = frozenset(
+            {
+                ".git",
+                ".venv",
+                "venv",
+                "__pycache__",
+                ".pytest_cache",
+                "node_modules",
+                ".tox",
+                "build",
+                "dist",
+                ".eggs",
+                "env",
+                ".coverage",
+                ".mypy_cache",
+                ".ruff_cache",
+            }
+        )
 
         # Files to ignore
-        self.ignore_files = {
-            ".DS_Store",
-            ".gitignore",
-            ".gitmodules",
-            "Thumbs.db",
-            ".coverage",
-            ".coveragerc",
-            ".python-version",
-        }
+        self.ignore_files = frozenset(
+            {
+                ".DS_Store",
+                ".gitignore",
+                ".gitmodules",
+                "Thumbs.db",
+                ".coverage",
+                ".coveragerc",
+                ".python-version",
+            }
+        )
+
+        # Test file detection
+        self._test_dir_names = frozenset({"test", "tests"})
 
         # Directory structure settings
         self.max_directory_depth = 3
 
+        # On-disk cache for AST tool results; unset disables it
+        cache_dir = os.getenv("MCP_CACHE_DIR")
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        # Pre-parse the project's Python files in the background at start-up.
+        # Opt-in: the parses compete for the GIL with the first tool calls
+        self.warm_cache = self._parse_bool_env("MCP_WARM_CACHE", False)
+
+        # Indent tool results for humans; compact JSON is smaller and faster
+        self.pretty_json = self._parse_bool_env("MCP_PRETTY_JSON", False)
+
         # Debug settings
         self.debug = self._parse_bool_env("MCP_DEBUG", False)
 
@@ -79,49 +117,53 @@ class MCPServerConfig:
         Returns:
             Boolean value
         """
-        try:
-            value = os.getenv(env_var)
-            if value is None:
-                return default
-
-            # Handle string values
-            if isinstance(value, str):
-                value_lower = value.lower().strip()
-                # Truthy values
-                if value_lower in ("true", "1", "yes", "on", "enabled"):
-                    return True
-                # Falsy values
-                elif value_lower in ("false", "0", "no", "off", "disabled", ""):
-                    return False
-                else:
-                    # Invalid string value, use default
-                    return default
-
-            # Handle non-string values (shouldn't happen with os.getenv, but be safe)
-            return bool(value)
-
-        except Exception:
-            # Any error in parsing, use default
+        value = os.getenv(env_var)
+        if value is None:
             return default
 
+        value_lower = value.strip().lower()
+        if value_lower in self._TRUE_VALUES:
+            return True
+        if value_lower in self._FALSE_VALUES:
+            return False
+
+        # Invalid string value, use default
+        return default
+
+    def is_ignored_component(self, name: str) -> bool:
+        """Check if a single path component puts everything below it out of scope."""
+        if name in self.ignore_dirs:
+            return True
+        # Only ignore hidden files/directories, not path navigation like '..'
+        return bool(name) and name[0] == "." and name not in ("..", ".")
+
     def is_ignored_path(self, path: Path) -> bool:
         """Check if a path should be ignored."""
-        parts = path.parts
-        for part in parts:
-            if part in self.ignore_dirs:
-                return True
-            # Only ignore hidden files/directories, not path navigation like '..'
-            if part.startswith(".") and part not in ("..", "."):
-                return True
+        if _ignored_component_re(self.ignore_dirs).search(str(path)):
+            return True
         return path.name in self.ignore_files
 
+    def is_python_file_str(self, name: str) -> bool:
+        """Check if a file name (not a full path) has a Python extension."""
+        # Same rules as Path.suffix: a leading or trailing dot is not a suffix
+        i = name.rfind(".")
+        return 0 < i < len(name) - 1 and name[i:] in self.python_extensions
+
+    def is_text_file_str(self, name: str) -> bool:
+        """Check if a file name (not a full path) has a text extension."""
+        i = name.rfind(".")
+        if not 0 < i < len(name) - 1:
+            return False
+        suffix = name[i:]
+        return suffix in self.text_extensions or suffix in self.python_extensions
+
     def is_python_file(self, path: Path) -> bool:
         """Check if a file is a Python file."""
-        return path.suffix in self.python_extensions
+        return self.is_python_file_str(path.name)
 
     def is_text_file(self, path: Path) -> bool:
         """Check if a file is a text file."""
-        return path.suffix in self.text_extensions or self.is_python_file(path)
+        return self.is_text_file_str(path.name)
 
     def is_test_file(self, path: Path) -> bool:
         """Check if a file is a test file."""
@@ -129,17 +171,15 @@ class MCPServerConfig:
             return False
 
         # Check if file is in a test directory
-        path_parts = path.parts
-        for part in path_parts:
-            if part.startswith("test") or part == "tests":
-                return True
+        if not self._test_dir_names.isdisjoint(str(path).split(os.sep)):
+            return True
 
         # Check if filename indicates it's a test file
         filename = path.name
         return (
             filename.startswith("test_")
             or filename.endswith("_test.py")
-            or filename == "test.py"
+            or filename in ("test.py", "tests.py")
         )
 
     def get_project_info(self) -> Dict[str, Any]:
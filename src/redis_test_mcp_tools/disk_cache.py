@@ -0,0 +1,78 @@
+"""
+On-disk cache for per-file tool results.
+
+Entries live in config.cache_dir (MCP_CACHE_DIR), one pickle per file, tool
+and arguments. The file's mtime and size are stored with the result and must
+match on load. Used by the server's per-file tool cache and by the parse
+workers of the test tools, so both share the same entries.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from . import __version__
+from .config import config
+
+# Bump when the pickled cache payload or the cached tools' output changes
+DISK_CACHE_FORMAT = 2
+
+# Returned by load_result when there is no usable entry
+MISSING = object()
+
+
+def _cache_file(
+    cache_dir: Path, full_path: str, tool_name: str, args: Tuple[Any, ...]
+) -> Path:
+    key = hashlib.sha1(
+        repr((full_path, tool_name, args, __version__, DISK_CACHE_FORMAT)).encode()
+    ).hexdigest()
+    # One file per (path, tool, args): a changed source file overwrites its
+    # entry instead of leaving the old one behind
+    return cache_dir / f"{key}.pkl"
+
+
+def load_result(
+    full_path: str, tool_name: str, args: Tuple[Any, ...], st: os.stat_result
+) -> Any:
+    """Return the cached result for this version of the file, or MISSING."""
+    cache_dir: Optional[Path] = config.cache_dir
+    if cache_dir is None:
+        return MISSING
+    try:
+        with open(_cache_file(cache_dir, full_path, tool_name, args), "rb") as f:
+            mtime_ns, size, result = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+        return MISSING
+    if mtime_ns != st.st_mtime_ns or size != st.st_size:
+        return MISSING
+    return result
+
+
+def store_result(
+    full_path: str,
+    tool_name: str,
+    args: Tuple[Any, ...],
+    st: os.stat_result,
+    result: Any,
+) -> None:
+    """Pickle a result for this version of the file; failures are ignored."""
+    cache_dir: Optional[Path] = config.cache_dir
+    if cache_dir is None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so readers never see a partial pickle
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(
+                (st.st_mtime_ns, st.st_size, result),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, _cache_file(cache_dir, full_path, tool_name, args))
+    except OSError:
+        pass
@@ -6,26 +6,37 @@ This MCP server provides tools to help with test generation and code exploration
 for the redis-py client library project.
 """
 
-from src.redis_test_mcp_tools.server import server
-from src.redis_test_mcp_tools.config import config
-from mcp.server.models import InitializationOptions
-from mcp.server import NotificationOptions
-import mcp.server.stdio
 import argparse
 import asyncio
+import os
 import sys
-from pathlib import Path
 
-# Add the project root to the Python path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from .config import config
 
 
-# Import configuration and server
+def _notify_ready() -> None:
+    """Report readiness to a launcher that passed a pipe in MCP_READY_FD."""
+    fd = os.environ.pop("MCP_READY_FD", None)
+    if fd is None:
+        return
+    try:
+        ready_fd = int(fd)
+        os.write(ready_fd, b"READY\n")
+        os.close(ready_fd)
+    except (OSError, ValueError):
+        # The launcher went away or the variable is bogus; serve anyway
+        pass
 
 
 async def main():
     """Run the MCP server."""
+    # The MCP SDK is only needed once we actually serve, not for --help
+    import mcp.server.stdio
+    from mcp.server import NotificationOptions
+    from mcp.server.models import InitializationOptions
+
+    from .server import server, warm_cache
+
     if config.debug:
         print(
             f"Starting MCP server: {config.server_name} v{config.server_version}",
@@ -35,18 +46,24 @@ async def main():
 
     # Run the server using stdin/stdout streams
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name=config.server_name,
-                server_version=config.server_version,
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+        _notify_ready()
+        warm_task = asyncio.create_task(warm_cache()) if config.warm_cache else None
+        try:
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name=config.server_name,
+                    server_version=config.server_version,
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+        finally:
+            if warm_task is not None:
+                warm_task.cancel()
 
 
 if __name__ == "__main__":
@@ -55,14 +72,17 @@ if __name__ == "__main__":
     parser.add_argument(
         "--max-file-size",
         type=int,
-        default=config.max_file_size,
-        help="Maximum file size to read in bytes",
+        default=None,
+        help=f"Maximum file size to read in bytes (default: {config.max_file_size})",
     )
     parser.add_argument(
         "--max-depth",
         type=int,
-        default=config.max_directory_depth,
-        help="Maximum directory depth to traverse",
+        default=None,
+        help=(
+            "Maximum directory depth to traverse "
+            f"(default: {config.max_directory_depth})"
+        ),
     )
     args = parser.parse_args()
 
@@ -73,10 +93,11 @@ if __name__ == "__main__":
 
         logging.basicConfig(level=logging.DEBUG)
 
-    if args.max_file_size:
+    # Only touch the config when the user overrode the default
+    if args.max_file_size is not None:
         config.max_file_size = args.max_file_size
 
-    if args.max_depth:
+    if args.max_depth is not None:
         config.max_directory_depth = args.max_depth
 
     asyncio.run(main())
@@ -5,14 +5,33 @@ MCP Server Implementation for Redis-py Test Infrastructure
 This module contains the MCP server setup and all tool handlers.
 """
 
+import asyncio
+import functools
 import json
+import os
+import re
+import reprlib
+import threading
+import traceback
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from mcp.server import Server
-from mcp.types import TextContent, Tool
+from mcp.types import CallToolResult, TextContent, Tool
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import configuration and tool modules
+from . import disk_cache
 from .config import config
 from .tools.ast_tools import (
     find_imports_in_file,
@@ -36,51 +55,81 @@ from .tools.test_tools import (
 )
 
 
-def _safe_json_dumps(obj: Any, indent: int = 2) -> str:
+def _json_default(item: Any) -> Any:
+    """Convert Path objects and other common non-serializable types."""
+    if isinstance(item, Path):
+        return str(item)
+    elif hasattr(item, "__dict__"):
+        return str(item)
+    elif hasattr(item, "isoformat"):  # datetime objects
+        return item.isoformat()
+    elif isinstance(item, set):
+        return list(item)
+    else:
+        return str(item)
+
+
+_PARTIAL_DATA_LIMIT = 500
+
+# Bounded repr for error payloads: never walks more than a few items per
+# container, so describing a huge (or cyclic) result stays cheap.
+_partial_reprlib = reprlib.Repr()
+_partial_reprlib.maxstring = _PARTIAL_DATA_LIMIT
+_partial_reprlib.maxother = _PARTIAL_DATA_LIMIT
+
+
+def _partial_repr(obj: Any) -> str:
+    """Return a short, bounded preview of obj for serialization errors."""
+    text = _partial_reprlib.repr(obj)
+    if len(text) > _PARTIAL_DATA_LIMIT:
+        return text[:_PARTIAL_DATA_LIMIT] + "..."
+    return text
+
+
+def _safe_json_dumps(obj: Any, indent: Optional[int] = None) -> str:
     """
     Safely serialize an object to JSON with proper error handling.
 
+    Uses orjson when it is installed (the "fast" extra) and falls back to the
+    standard library for anything orjson rejects.
+
     Args:
         obj: Object to serialize
-        indent: JSON indentation
+        indent: JSON indentation, or None for compact output
 
     Returns:
         JSON string or error message
     """
+    separators = (",", ":") if indent is None else None
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option).decode()
+        except (TypeError, ValueError, RecursionError):
+            # e.g. integers beyond 64 bits; let the stdlib path handle it
+            pass
+
     try:
-        # First attempt: direct serialization
-        return json.dumps(obj, indent=indent)
+        # Non-serializable values go through _json_default in the same pass
+        return json.dumps(
+            obj,
+            indent=indent,
+            separators=separators,
+            default=_json_default,
+            ensure_ascii=False,
+        )
     except TypeError as e:
-        # Handle non-serializable objects
-        try:
-            # Convert Path objects and other common non-serializable types
-            def convert_obj(item):
-                if isinstance(item, Path):
-                    return str(item)
-                elif hasattr(item, "__dict__"):
-                    return str(item)
-                elif hasattr(item, "isoformat"):  # datetime objects
-                    return item.isoformat()
-                elif isinstance(item, set):
-                    return list(item)
-                else:
-                    return str(item)
-
-            # Try to convert and serialize
-            converted = json.loads(json.dumps(obj, default=convert_obj))
-            return json.dumps(converted, indent=indent)
-        except Exception:
-            # Last resort: return error info
-            return json.dumps(
-                {
-                    "error": f"Serialization error: {str(e)}",
-                    "type": str(type(obj)),
-                    "partial_data": (
-                        str(obj)[:500] + "..." if len(str(obj)) > 500 else str(obj)
-                    ),
-                },
-                indent=indent,
-            )
+        # e.g. dict keys that are not str, int, float, bool or None
+        return json.dumps(
+            {
+                "error": f"Serialization error: {str(e)}",
+                "type": str(type(obj)),
+                "partial_data": _partial_repr(obj),
+            },
+            indent=indent,
+        )
     except (ValueError, RecursionError) as e:
         # Handle circular references and other JSON errors
         return json.dumps(
@@ -97,6 +146,123 @@ def _safe_json_dumps(obj: Any, indent: int = 2) -> str:
         )
 
 
+_MISSING = object()
+
+# In-process LRU in front of the on-disk cache, shared by all per-file tools
+_MEMORY_CACHE_SIZE = 256
+_memory_cache: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+_memory_cache_lock = threading.Lock()
+# The objects currently held in _memory_cache, by identity
+_cached_results: Dict[int, Any] = {}
+
+
+def _memory_cache_get(key: Tuple[Any, ...]) -> Any:
+    with _memory_cache_lock:
+        result = _memory_cache.get(key, _MISSING)
+        if result is not _MISSING:
+            _memory_cache.move_to_end(key)
+        return result
+
+
+def _memory_cache_put(key: Tuple[Any, ...], result: Any) -> None:
+    with _memory_cache_lock:
+        old = _memory_cache.get(key, _MISSING)
+        if old is not _MISSING:
+            _cached_results.pop(id(old), None)
+        _memory_cache[key] = result
+        _memory_cache.move_to_end(key)
+        _cached_results[id(result)] = result
+        if len(_memory_cache) > _MEMORY_CACHE_SIZE:
+            _, evicted = _memory_cache.popitem(last=False)
+            _cached_results.pop(id(evicted), None)
+
+
+# Serialized text of results served from the LRU above, keyed by identity and
+# indentation
+_text_cache: "OrderedDict[Tuple[int, Optional[int]], Tuple[Any, str]]" = OrderedDict()
+
+
+def _response_indent() -> Optional[int]:
+    """Indentation for tool responses: compact unless MCP_PRETTY_JSON is set."""
+    return 2 if config.pretty_json else None
+
+
+def _dumps_memoized(result: Any) -> str:
+    """
+    Serialize a tool result, reusing the text when the same object comes back.
+
+    Results of the per-file tools are shared objects from the in-process LRU,
+    so a repeat call returns the identical object. Only such objects are
+    memoized; anything else (errors, uncached calls) is serialized afresh.
+    The entry keeps a reference to the result, so its id cannot be reused
+    while cached.
+    """
+    indent = _response_indent()
+    key = (id(result), indent)
+    with _memory_cache_lock:
+        cached = _cached_results.get(id(result)) is result
+        entry = _text_cache.get(key) if cached else None
+        if entry is not None and entry[0] is result:
+            _text_cache.move_to_end(key)
+            return entry[1]
+
+    text = _safe_json_dumps(result, indent)
+    if not cached:
+        return text
+    with _memory_cache_lock:
+        _text_cache[key] = (result, text)
+        _text_cache.move_to_end(key)
+        if len(_text_cache) > _MEMORY_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    return text
+
+
+def _ast_file_cache(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Cache results of a per-file tool, keyed by file mtime and size.
+
+    The wrapped function must take a project-relative file path as its first
+    argument. Results are kept in an in-process LRU and, when config.cache_dir
+    is set, pickled to disk. Nothing is cached when the file cannot be stat'ed
+    or when the tool returns an error dict.
+    """
+
+    @functools.wraps(func)
+    def wrapper(file_path: str, *args: Any) -> Any:
+        full_path = os.path.abspath(config.project_root / file_path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return func(file_path, *args)
+
+        memory_key = (func.__name__, full_path, args, st.st_mtime_ns, st.st_size)
+        result = _memory_cache_get(memory_key)
+        if result is not _MISSING:
+            return result
+
+        result = disk_cache.load_result(full_path, func.__name__, args, st)
+        if result is not disk_cache.MISSING:
+            _memory_cache_put(memory_key, result)
+            return result
+
+        result = func(file_path, *args)
+        if isinstance(result, dict) and "error" in result:
+            return result
+        _memory_cache_put(memory_key, result)
+        disk_cache.store_result(full_path, func.__name__, args, st, result)
+        return result
+
+    return wrapper
+
+
+_cached_parse_module_ast = _ast_file_cache(parse_module_ast)
+_cached_get_function_details = _ast_file_cache(get_function_details)
+_cached_get_class_details = _ast_file_cache(get_class_details)
+_cached_find_imports_in_file = _ast_file_cache(find_imports_in_file)
+_cached_get_type_hints_from_file = _ast_file_cache(get_type_hints_from_file)
+_cached_suggest_test_cases = _ast_file_cache(suggest_test_cases)
+
+
 def _validate_file_path(file_path: str) -> str:
     """
     Validate and sanitize file path parameter.
@@ -113,11 +279,17 @@ def _validate_file_path(file_path: str) -> str:
     if not file_path or not isinstance(file_path, str):
         raise ValueError("file_path must be a non-empty string")
 
-    # Basic path validation (more detailed validation is done in file_tools)
-    if ".." in file_path or file_path.startswith("/"):
+    # Basic path validation (more detailed validation is done in file_tools).
+    # Normalizing first rejects "a/../../b" but allows names like "..data".
+    normalized = os.path.normpath(file_path.strip())
+    if (
+        os.path.isabs(normalized)
+        or normalized == os.pardir
+        or normalized.startswith(os.pardir + os.sep)
+    ):
         raise ValueError("Invalid path: path traversal or absolute paths not allowed")
 
-    return file_path.strip()
+    return normalized
 
 
 def _validate_max_size(max_size: Any) -> int:
@@ -136,15 +308,20 @@ def _validate_max_size(max_size: Any) -> int:
     if max_size is None:
         return config.max_file_size
 
-    try:
-        size = int(max_size)
-        if size < 0:
-            raise ValueError("max_size must be non-negative")
-        if size > 100 * 1024 * 1024:  # 100MB limit
-            raise ValueError("max_size too large (max 100MB)")
-        return size
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"max_size must be a valid integer: {str(e)}")
+    # JSON integers arrive as int already; only convert other types
+    if type(max_size) is int:
+        size = max_size
+    else:
+        try:
+            size = int(max_size)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"max_size must be a valid integer: {str(e)}")
+
+    if size < 0:
+        raise ValueError("max_size must be non-negative")
+    if size > 100 * 1024 * 1024:  # 100MB limit
+        raise ValueError("max_size too large (max 100MB)")
+    return size
 
 
 def _validate_max_depth(max_depth: Any) -> int:
@@ -163,15 +340,20 @@ def _validate_max_depth(max_depth: Any) -> int:
     if max_depth is None:
         return config.max_directory_depth
 
-    try:
-        depth = int(max_depth)
-        if depth < 0:
-            raise ValueError("max_depth must be non-negative")
-        if depth > 20:  # Reasonable limit
-            raise ValueError("max_depth too large (max 20)")
-        return depth
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"max_depth must be a valid integer: {str(e)}")
+    # JSON integers arrive as int already; only convert other types
+    if type(max_depth) is int:
+        depth = max_depth
+    else:
+        try:
+            depth = int(max_depth)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"max_depth must be a valid integer: {str(e)}")
+
+    if depth < 0:
+        raise ValueError("max_depth must be non-negative")
+    if depth > 20:  # Reasonable limit
+        raise ValueError("max_depth too large (max 20)")
+    return depth
 
 
 def _validate_framework(framework: Any) -> Optional[str]:
@@ -200,6 +382,10 @@ def _validate_framework(framework: Any) -> Optional[str]:
     return framework
 
 
+# \w is Unicode-aware, so non-ASCII identifiers stay valid as in Python itself
+_IDENTIFIER_RE = re.compile(r"[^\W\d]\w*(?:\.[^\W\d]\w*)*\Z")
+
+
 def _validate_identifier(identifier: str, name: str) -> str:
     """
     Validate function/class name parameter.
@@ -219,277 +405,625 @@ def _validate_identifier(identifier: str, name: str) -> str:
 
     identifier = identifier.strip()
 
-    # Basic Python identifier validation
-    if not identifier.replace("_", "").replace(".", "").isalnum():
+    # Python identifier, optionally dotted (e.g. "Class.method")
+    if not _IDENTIFIER_RE.match(identifier):
         raise ValueError(f"{name} must be a valid Python identifier")
 
     return identifier
 
 
-# Create the server instance
-server = Server(config.server_name)
-
-
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """
-    List available tools.
-
-    Returns:
-        List of Tool objects that this server provides.
-    """
-    return [
-        Tool(
-            name="find_python_files",
-            description="List all Python files in the project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "directory": {
-                        "type": "string",
-                        "description": (
-                            "Directory to search in (relative to project root). "
-                            "If not specified, searches entire project."
-                        ),
-                    }
-                },
-                "additionalProperties": False,
+# Upper bounds for batch_execute requests
+MAX_BATCH_OPERATIONS = 50
+MAX_BATCH_CONCURRENCY = 16
+
+# Tool definitions are static, so build them once at import time
+_TOOLS: List[Tool] = [
+    Tool(
+        name="find_python_files",
+        description="List all Python files in the project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": (
+                        "Directory to search in (relative to project root). "
+                        "If not specified, searches entire project."
+                    ),
+                }
             },
-        ),
-        Tool(
-            name="read_file",
-            description="Read the contents of a file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the file to read (relative to project root)",
-                    },
-                    "max_size": {
-                        "type": "integer",
-                        "description": "Maximum file size to read in bytes (default: 1MB)",
-                        "default": 1048576,
-                    },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="read_file",
+        description="Read the contents of a file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to read (relative to project root)",
                 },
-                "required": ["file_path"],
-                "additionalProperties": False,
-            },
-        ),
-        Tool(
-            name="get_directory_structure",
-            description="Show the directory structure of the project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "directory": {
-                        "type": "string",
-                        "description": (
-                            "Directory to show structure for (relative to project root). "
-                            "If not specified, shows entire project."
-                        ),
-                    },
-                    "max_depth": {
-                        "type": "integer",
-                        "description": "Maximum depth to traverse (default: 3)",
-                        "default": 3,
-                    },
+                "max_size": {
+                    "type": "integer",
+                    "description": "Maximum file size to read in bytes (default: 1MB)",
+                    "default": 1048576,
                 },
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="get_project_info",
-            description="Get comprehensive information about the project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "random_string": {
-                        "type": "string",
-                        "description": "Dummy parameter for no-parameter tools",
-                    }
+            "required": ["file_path"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_directory_structure",
+        description="Show the directory structure of the project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": (
+                        "Directory to show structure for (relative to project root). "
+                        "If not specified, shows entire project."
+                    ),
                 },
-                "required": ["random_string"],
-            },
-        ),
-        Tool(
-            name="parse_module",
-            description="Parse a Python file and return classes, functions, and their signatures",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the Python file to parse (relative to project root)",
-                    }
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Maximum depth to traverse (default: 3)",
+                    "default": 3,
                 },
-                "required": ["file_path"],
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="get_function_details",
-            description="Get detailed information about a specific function (params, return type, docstring)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the Python file containing the function (relative to project root)",
-                    },
-                    "function_name": {
-                        "type": "string",
-                        "description": "Name of the function to analyze",
-                    },
-                },
-                "required": ["file_path", "function_name"],
-                "additionalProperties": False,
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_project_info",
+        description="Get comprehensive information about the project",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "random_string": {
+                    "type": "string",
+                    "description": "Dummy parameter for no-parameter tools",
+                }
             },
-        ),
-        Tool(
-            name="get_class_details",
-            description="Get class methods, properties, and inheritance information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the Python file containing the class (relative to project root)",
-                    },
-                    "class_name": {
-                        "type": "string",
-                        "description": "Name of the class to analyze",
-                    },
-                },
-                "required": ["file_path", "class_name"],
-                "additionalProperties": False,
+            "required": ["random_string"],
+        },
+    ),
+    Tool(
+        name="parse_module",
+        description="Parse a Python file and return classes, functions, and their signatures",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the Python file to parse (relative to project root)",
+                }
             },
-        ),
-        Tool(
-            name="find_imports",
-            description="Show what modules/packages a file imports",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the Python file to analyze imports (relative to project root)",
-                    }
+            "required": ["file_path"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_function_details",
+        description="Get detailed information about a specific function (params, return type, docstring)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the Python file containing the function (relative to project root)",
                 },
-                "required": ["file_path"],
-                "additionalProperties": False,
-            },
-        ),
-        Tool(
-            name="get_type_hints",
-            description="Extract type annotations from functions/methods in a Python file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the Python file to extract type hints from (relative to project root)",
-                    }
+                "function_name": {
+                    "type": "string",
+                    "description": "Name of the function to analyze",
                 },
-                "required": ["file_path"],
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="analyze_test_files",
-            description="Find and parse existing test files, show test structure including fixtures, markers, and test functions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "directory": {
-                        "type": "string",
-                        "description": "Directory to search for test files (relative to project root). If not specified, searches entire project.",
-                    }
+            "required": ["file_path", "function_name"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_class_details",
+        description="Get class methods, properties, and inheritance information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the Python file containing the class (relative to project root)",
+                },
+                "class_name": {
+                    "type": "string",
+                    "description": "Name of the class to analyze",
                 },
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="get_test_patterns",
-            description="Identify common testing patterns used in the project (fixtures, mocks, frameworks, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "directory": {
-                        "type": "string",
-                        "description": "Directory to analyze for test patterns (relative to project root). If not specified, analyzes entire project.",
-                    }
+            "required": ["file_path", "class_name"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="find_imports",
+        description="Show what modules/packages a file imports",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the Python file to analyze imports (relative to project root)",
+                }
+            },
+            "required": ["file_path"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_type_hints",
+        description="Extract type annotations from functions/methods in a Python file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the Python file to extract type hints from (relative to project root)",
+                }
+            },
+            "required": ["file_path"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="analyze_test_files",
+        description="Find and parse existing test files, show test structure including fixtures, markers, and test functions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "Directory to search for test files (relative to project root). If not specified, searches entire project.",
+                }
+            },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_test_patterns",
+        description="Identify common testing patterns used in the project (fixtures, mocks, frameworks, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "directory": {
+                    "type": "string",
+                    "description": "Directory to analyze for test patterns (relative to project root). If not specified, analyzes entire project.",
+                }
+            },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="find_untested_code",
+        description="Compare source files with test files to find untested functions/classes",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_dir": {
+                    "type": "string",
+                    "description": "Source directory to analyze (relative to project root). If not specified, analyzes entire project.",
+                },
+                "test_dir": {
+                    "type": "string",
+                    "description": "Test directory to use for comparison (relative to project root). If not specified, uses 'tests' directory.",
                 },
-                "additionalProperties": False,
             },
-        ),
-        Tool(
-            name="find_untested_code",
-            description="Compare source files with test files to find untested functions/classes",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_dir": {
-                        "type": "string",
-                        "description": "Source directory to analyze (relative to project root). If not specified, analyzes entire project.",
-                    },
-                    "test_dir": {
-                        "type": "string",
-                        "description": "Test directory to use for comparison (relative to project root). If not specified, uses 'tests' directory.",
-                    },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="suggest_test_cases",
+        description="Based on function signatures and docstrings, suggest what test cases should exist for both pytest and unittest frameworks",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the Python file to analyze (relative to project root)",
+                },
+                "function_name": {
+                    "type": "string",
+                    "description": (
+                        "Name of specific function to generate test suggestions for. "
+                        "If not specified, generates suggestions for all functions and classes."
+                    ),
+                },
+                "class_name": {
+                    "type": "string",
+                    "description": "Name of specific class to generate test suggestions for. If not specified, generates suggestions for all functions and classes.",
                 },
-                "additionalProperties": False,
+                "framework": {
+                    "type": "string",
+                    "description": "Testing framework to target ('pytest' or 'unittest'). If not specified, auto-detects from project patterns.",
+                    "enum": ["pytest", "unittest"],
+                },
+            },
+            "required": ["file_path"],
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="get_test_coverage_info",
+        description="Parse and show coverage information from pytest-cov data (supports .coverage, coverage.xml)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "coverage_file": {
+                    "type": "string",
+                    "description": "Path to coverage file (relative to project root). If not specified, searches for common coverage files.",
+                }
             },
+            "additionalProperties": False,
+        },
+    ),
+    Tool(
+        name="batch_execute",
+        description=(
+            "Run several of the other tools in one request and return all results "
+            "together. Operations run concurrently and results keep input order."
         ),
-        Tool(
-            name="suggest_test_cases",
-            description="Based on function signatures and docstrings, suggest what test cases should exist for both pytest and unittest frameworks",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the Python file to analyze (relative to project root)",
-                    },
-                    "function_name": {
-                        "type": "string",
-                        "description": (
-                            "Name of specific function to generate test suggestions for. "
-                            "If not specified, generates suggestions for all functions and classes."
-                        ),
-                    },
-                    "class_name": {
-                        "type": "string",
-                        "description": "Name of specific class to generate test suggestions for. If not specified, generates suggestions for all functions and classes.",
-                    },
-                    "framework": {
-                        "type": "string",
-                        "description": "Testing framework to target ('pytest' or 'unittest'). If not specified, auto-detects from project patterns.",
-                        "enum": ["pytest", "unittest"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool",
+                            },
+                        },
+                        "required": ["name"],
+                        "additionalProperties": False,
                     },
+                    "minItems": 1,
+                    "maxItems": MAX_BATCH_OPERATIONS,
                 },
-                "required": ["file_path"],
-                "additionalProperties": False,
-            },
-        ),
-        Tool(
-            name="get_test_coverage_info",
-            description="Parse and show coverage information from pytest-cov data (supports .coverage, coverage.xml)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "coverage_file": {
-                        "type": "string",
-                        "description": "Path to coverage file (relative to project root). If not specified, searches for common coverage files.",
-                    }
+                "maxConcurrent": {
+                    "type": "integer",
+                    "description": "Maximum number of operations running at once (default: 4)",
+                    "default": 4,
+                },
+                "stopOnError": {
+                    "type": "boolean",
+                    "description": "Skip operations that have not started yet once one fails (default: false)",
+                    "default": False,
                 },
-                "additionalProperties": False,
             },
-        ),
-    ]
+            "required": ["operations"],
+            "additionalProperties": False,
+        },
+    ),
+]
+
+
+def _build_validators(tools: List[Tool]) -> Dict[str, Any]:
+    """Check each tool's inputSchema once and build a reusable validator for it."""
+    if jsonschema is None:
+        return {}
+
+    validators = {}
+    for tool in tools:
+        validator_class = jsonschema.validators.validator_for(tool.inputSchema)
+        validator_class.check_schema(tool.inputSchema)
+        validators[tool.name] = validator_class(tool.inputSchema)
+    return validators
+
+
+_VALIDATORS = _build_validators(_TOOLS)
+
+
+def _validate_arguments(name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """
+    Validate tool arguments against the tool's inputSchema.
+
+    Args:
+        name: Name of the tool
+        arguments: Tool arguments
+
+    Returns:
+        Error message, or None if the arguments are valid or the tool is unknown
+    """
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        return None
+
+    # Same error selection as jsonschema.validate(), minus the per-call
+    # schema check and validator construction
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    if error is None:
+        return None
+    return f"Input validation error: {error.message}"
+
+
+# Create the server instance
+server = Server(config.server_name)
+
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """
+    List available tools.
+
+    Returns:
+        List of Tool objects that this server provides.
+    """
+    return _TOOLS
+
+
+def _optional(
+    arguments: Dict[str, Any], key: str, validator: Callable[..., Any], *extra: Any
+) -> Any:
+    """Validate an optional argument, passing None through untouched."""
+    value = arguments.get(key)
+    if value is None:
+        return None
+    return validator(value, *extra)
+
+
+def _call_find_python_files(arguments: Dict[str, Any]) -> Any:
+    return find_python_files(arguments.get("directory"))
+
+
+def _call_read_file(arguments: Dict[str, Any]) -> Any:
+    file_path = _validate_file_path(arguments["file_path"])
+    max_size = _validate_max_size(arguments.get("max_size"))
+    return read_file_content(file_path, max_size)
+
+
+def _call_get_directory_structure(arguments: Dict[str, Any]) -> Any:
+    directory = _optional(arguments, "directory", _validate_file_path)
+    max_depth = _validate_max_depth(arguments.get("max_depth"))
+    return get_directory_structure(directory, max_depth)
+
+
+def _call_get_project_info(arguments: Dict[str, Any]) -> Any:
+    return get_project_info()
+
+
+def _call_parse_module(arguments: Dict[str, Any]) -> Any:
+    return _cached_parse_module_ast(_validate_file_path(arguments["file_path"]))
+
+
+def _call_get_function_details(arguments: Dict[str, Any]) -> Any:
+    file_path = _validate_file_path(arguments["file_path"])
+    function_name = _validate_identifier(arguments["function_name"], "function_name")
+    return _cached_get_function_details(file_path, function_name)
+
+
+def _call_get_class_details(arguments: Dict[str, Any]) -> Any:
+    file_path = _validate_file_path(arguments["file_path"])
+    class_name = _validate_identifier(arguments["class_name"], "class_name")
+    return _cached_get_class_details(file_path, class_name)
+
+
+def _call_find_imports(arguments: Dict[str, Any]) -> Any:
+    return _cached_find_imports_in_file(arguments["file_path"])
+
+
+def _call_get_type_hints(arguments: Dict[str, Any]) -> Any:
+    return _cached_get_type_hints_from_file(arguments["file_path"])
+
+
+def _call_analyze_test_files(arguments: Dict[str, Any]) -> Any:
+    return analyze_test_files(arguments.get("directory"))
+
+
+def _call_get_test_patterns(arguments: Dict[str, Any]) -> Any:
+    return get_test_patterns(arguments.get("directory"))
+
+
+def _call_find_untested_code(arguments: Dict[str, Any]) -> Any:
+    return find_untested_code(arguments.get("source_dir"), arguments.get("test_dir"))
+
+
+def _call_suggest_test_cases(arguments: Dict[str, Any]) -> Any:
+    file_path = _validate_file_path(arguments["file_path"])
+    function_name = _optional(
+        arguments, "function_name", _validate_identifier, "function_name"
+    )
+    class_name = _optional(arguments, "class_name", _validate_identifier, "class_name")
+    framework = _validate_framework(arguments.get("framework"))
+    if framework is None:
+        # The framework is then detected from every test file in the project,
+        # which a cache keyed on this one file cannot see change
+        return suggest_test_cases(file_path, function_name, class_name)
+    return _cached_suggest_test_cases(file_path, function_name, class_name, framework)
+
+
+def _call_get_test_coverage_info(arguments: Dict[str, Any]) -> Any:
+    return get_test_coverage_info(arguments.get("coverage_file"))
+
+
+# Tools whose results come from _ast_file_cache and can reuse serialized text
+_MEMOIZED_TOOLS = frozenset(
+    {
+        "parse_module",
+        "get_function_details",
+        "get_class_details",
+        "find_imports",
+        "get_type_hints",
+        "suggest_test_cases",
+    }
+)
+
+# Tool name -> handler taking the raw arguments dict and returning the result
+_DISPATCH: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "find_python_files": _call_find_python_files,
+    "read_file": _call_read_file,
+    "get_directory_structure": _call_get_directory_structure,
+    "get_project_info": _call_get_project_info,
+    "parse_module": _call_parse_module,
+    "get_function_details": _call_get_function_details,
+    "get_class_details": _call_get_class_details,
+    "find_imports": _call_find_imports,
+    "get_type_hints": _call_get_type_hints,
+    "analyze_test_files": _call_analyze_test_files,
+    "get_test_patterns": _call_get_test_patterns,
+    "find_untested_code": _call_find_untested_code,
+    "suggest_test_cases": _call_suggest_test_cases,
+    "get_test_coverage_info": _call_get_test_coverage_info,
+}
+
+
+async def warm_cache(max_concurrent: int = 1) -> int:
+    """
+    Pre-parse the project's Python files so early parse_module calls hit the cache.
+
+    Runs at most max_concurrent parses at a time to leave room for real
+    requests. Without a disk cache only as many files as the in-process LRU
+    holds are parsed.
+
+    Returns:
+        Number of files parsed
+    """
+    files = await asyncio.to_thread(find_python_files, with_stats=False)
+    if isinstance(files, dict):
+        return 0
+    if config.cache_dir is None:
+        files = files[:_MEMORY_CACHE_SIZE]
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def warm(file_path: str) -> None:
+        async with semaphore:
+            await asyncio.to_thread(_cached_parse_module_ast, file_path)
+
+    await asyncio.gather(*(warm(f["path"]) for f in files), return_exceptions=True)
+    return len(files)
+
+
+def _validate_batch_operations(operations: Any) -> List[Dict[str, Any]]:
+    """
+    Validate the operations list of a batch_execute call.
+
+    Args:
+        operations: The operations value to validate
+
+    Returns:
+        List of operations with "name" and "arguments" keys
+
+    Raises:
+        ValueError: If operations is invalid
+    """
+    if not isinstance(operations, list) or not operations:
+        raise ValueError("operations must be a non-empty list")
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise ValueError(f"too many operations (max {MAX_BATCH_OPERATIONS})")
+
+    validated = []
+    for op in operations:
+        if not isinstance(op, dict) or not isinstance(op.get("name"), str):
+            raise ValueError("each operation must be an object with a 'name'")
+        arguments = op.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise ValueError("operation arguments must be an object")
+        validated.append({"name": op["name"], "arguments": arguments})
+    return validated
+
+
+def _validate_max_concurrent(max_concurrent: Any) -> int:
+    """
+    Validate maxConcurrent parameter.
+
+    Args:
+        max_concurrent: The concurrency value to validate
+
+    Returns:
+        Validated concurrency as integer
+
+    Raises:
+        ValueError: If max_concurrent is invalid
+    """
+    if max_concurrent is None:
+        return 4
+
+    if type(max_concurrent) is int:
+        value = max_concurrent
+    else:
+        try:
+            value = int(max_concurrent)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"maxConcurrent must be a valid integer: {str(e)}")
+    if value < 1:
+        raise ValueError("maxConcurrent must be at least 1")
+    return min(value, MAX_BATCH_CONCURRENCY)
+
+
+async def _batch_execute(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Run several tool calls concurrently and collect their results in order."""
+    operations = _validate_batch_operations(arguments.get("operations"))
+    semaphore = asyncio.Semaphore(
+        _validate_max_concurrent(arguments.get("maxConcurrent"))
+    )
+    stop_on_error = bool(arguments.get("stopOnError", False))
+    failed = False
+
+    async def run(op: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal failed
+        name = op["name"]
+        async with semaphore:
+            if stop_on_error and failed:
+                return {"name": name, "skipped": True}
+            try:
+                handler = _DISPATCH.get(name)
+                if handler is None:
+                    raise ValueError(f"Unknown tool: {name}")
+                error = _validate_arguments(name, op["arguments"])
+                if error is not None:
+                    raise ValueError(error)
+                result = await asyncio.to_thread(handler, op["arguments"])
+                return {"name": name, "success": True, "result": result}
+            except Exception as e:
+                failed = True
+                return {
+                    "name": name,
+                    "success": False,
+                    "error": f"Error executing {name}: {str(e)}",
+                }
+
+    results = await asyncio.gather(*(run(op) for op in operations))
+    return {
+        "results": results,
+        "total": len(results),
+        "succeeded": sum(1 for r in results if r.get("success")),
+        "failed": sum(1 for r in results if r.get("success") is False),
+        "skipped": sum(1 for r in results if r.get("skipped")),
+    }
+
+
+def _ok(result: Any, memoize: bool = False) -> List[TextContent]:
+    """Wrap a tool result in the single TextContent every tool call returns."""
+    if memoize:
+        text = _dumps_memoized(result)
+    else:
+        text = _safe_json_dumps(result, _response_indent())
+    return [TextContent(type="text", text=text)]
+
+
+def _run_tool(
+    name: str, handler: Callable[[Dict[str, Any]], Any], arguments: Dict[str, Any]
+) -> List[TextContent]:
+    """Run a tool handler and serialize its result; called in a worker thread."""
+    return _ok(handler(arguments), memoize=name in _MEMOIZED_TOOLS)
 
 
-@server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """
     Handle tool calls.
@@ -502,98 +1036,44 @@ async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextCon
         List of TextContent with tool results
     """
     try:
-        if name == "find_python_files":
-            directory = arguments.get("directory")
-            files = find_python_files(directory)
-            return [TextContent(type="text", text=_safe_json_dumps(files))]
-
-        elif name == "read_file":
-            file_path = _validate_file_path(arguments["file_path"])
-            max_size = _validate_max_size(arguments.get("max_size"))
-            content = read_file_content(file_path, max_size)
-            return [TextContent(type="text", text=_safe_json_dumps(content))]
-
-        elif name == "get_directory_structure":
-            directory = arguments.get("directory")
-            if directory is not None:
-                directory = _validate_file_path(directory)
-            max_depth = _validate_max_depth(arguments.get("max_depth"))
-            structure = get_directory_structure(directory, max_depth)
-            return [TextContent(type="text", text=_safe_json_dumps(structure))]
-
-        elif name == "get_project_info":
-            info = get_project_info()
-            return [TextContent(type="text", text=_safe_json_dumps(info))]
-
-        elif name == "parse_module":
-            file_path = _validate_file_path(arguments["file_path"])
-            result = parse_module_ast(file_path)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "get_function_details":
-            file_path = _validate_file_path(arguments["file_path"])
-            function_name = _validate_identifier(
-                arguments["function_name"], "function_name"
-            )
-            result = get_function_details(file_path, function_name)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "get_class_details":
-            file_path = _validate_file_path(arguments["file_path"])
-            class_name = _validate_identifier(arguments["class_name"], "class_name")
-            result = get_class_details(file_path, class_name)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "find_imports":
-            file_path = arguments["file_path"]
-            result = find_imports_in_file(file_path)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "get_type_hints":
-            file_path = arguments["file_path"]
-            result = get_type_hints_from_file(file_path)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "analyze_test_files":
-            directory = arguments.get("directory")
-            result = analyze_test_files(directory)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "get_test_patterns":
-            directory = arguments.get("directory")
-            result = get_test_patterns(directory)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "find_untested_code":
-            source_dir = arguments.get("source_dir")
-            test_dir = arguments.get("test_dir")
-            result = find_untested_code(source_dir, test_dir)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "suggest_test_cases":
-            file_path = _validate_file_path(arguments["file_path"])
-            function_name = arguments.get("function_name")
-            if function_name is not None:
-                function_name = _validate_identifier(function_name, "function_name")
-            class_name = arguments.get("class_name")
-            if class_name is not None:
-                class_name = _validate_identifier(class_name, "class_name")
-            framework = _validate_framework(arguments.get("framework"))
-            result = suggest_test_cases(file_path, function_name, class_name, framework)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        elif name == "get_test_coverage_info":
-            coverage_file = arguments.get("coverage_file")
-            result = get_test_coverage_info(coverage_file)
-            return [TextContent(type="text", text=_safe_json_dumps(result))]
-
-        else:
+        if name == "batch_execute":
+            result = await _batch_execute(arguments)
+            return await asyncio.to_thread(_ok, result)
+
+        handler = _DISPATCH.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
 
+        # Tool implementations do blocking file I/O and AST parsing, and large
+        # results take a while to encode; do both in a worker thread so
+        # concurrent calls don't stall the event loop
+        return await asyncio.to_thread(_run_tool, name, handler, arguments)
+
     except Exception as e:
         error_msg = f"Error executing {name}: {str(e)}"
         if config.debug:
-            import traceback
-
-            error_msg += f"\n\nTraceback:\n{traceback.format_exc()}"
+            error_msg += "\n\nTraceback:\n" + "".join(
+                traceback.TracebackException.from_exception(e).format()
+            )
         return [TextContent(type="text", text=error_msg)]
+
+
+async def _handle_call_tool_request(
+    name: str, arguments: Dict[str, Any]
+) -> Union[CallToolResult, List[TextContent]]:
+    """Validate arguments with the precompiled validators, then run the tool."""
+    error = _validate_arguments(name, arguments)
+    if error is not None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=error)], isError=True
+        )
+    return await handle_call_tool(name, arguments)
+
+
+try:
+    # Validation happens in _handle_call_tool_request instead
+    _register_call_tool = server.call_tool(validate_input=False)
+except TypeError:
+    # Older mcp releases don't validate input themselves
+    _register_call_tool = server.call_tool()
+_register_call_tool(_handle_call_tool_request)
@@ -6,66 +6,107 @@ information about classes, functions, imports, and type hints.
 """
 
 import ast
-from typing import Any, Dict, Optional, Union
+import os
+import stat
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 # Import configuration
 from ..config import config
+from .file_tools import read_file_bytes
+
+_DOCSTRING_TYPES = frozenset(
+    {ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module}
+)
+_NAME_TYPES = frozenset({ast.Name, ast.Attribute})
+_PLAIN_CONSTANT_TYPES = frozenset({bool, int, type(None)})
+
+AST_CACHE_SIZE = 128
+
+
+# Parsed trees by (path, mtime_ns, ctime_ns, size), least recently used first
+_tree_cache: "OrderedDict[Tuple[str, int, int, int], ast.Module]" = OrderedDict()
+_tree_cache_lock = threading.Lock()
+
+
+def _parse_cached(path: str, mtime_ns: int, ctime_ns: int, size: int) -> ast.Module:
+    """Parse a file once per version; the stat fields invalidate the entry."""
+    key = (path, mtime_ns, ctime_ns, size)
+    with _tree_cache_lock:
+        tree = _tree_cache.get(key)
+        if tree is not None:
+            _tree_cache.move_to_end(key)
+            return tree
+
+    # Bytes go straight to the tokenizer, which also honours BOMs and
+    # PEP 263 coding cookies
+    tree = ast.parse(read_file_bytes(path))
+    with _tree_cache_lock:
+        _tree_cache[key] = tree
+        if len(_tree_cache) > AST_CACHE_SIZE:
+            _tree_cache.popitem(last=False)
+    return tree
+
+
+def has_cached_tree(file_path: str) -> bool:
+    """Check whether the current version of a file has already been parsed."""
+    full_path = os.path.join(config.project_root, file_path)
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return False
+    key = (full_path, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    with _tree_cache_lock:
+        return key in _tree_cache
+
+
+def clear_cache() -> None:
+    """Drop all cached syntax trees."""
+    with _tree_cache_lock:
+        _tree_cache.clear()
 
 
 def get_ast_from_file(file_path: str) -> Union[ast.AST, Dict[str, str]]:
     """Parse a Python file and return its AST or error information."""
     try:
-        full_path = config.project_root / file_path
+        full_path = os.path.join(config.project_root, file_path)
 
-        # Check if file exists first
-        if not full_path.exists():
+        # A single stat answers existence, file type and size
+        try:
+            st = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
             return {"error": f"File not found: {file_path}"}
+        except OSError as e:
+            return {"error": f"Cannot access file: {file_path} - {str(e)}"}
 
         # Check if it's actually a file (not directory)
-        if not full_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {"error": f"Path is not a file: {file_path}"}
 
         # Check file type before trying to read
-        if not config.is_python_file(full_path):
+        if not config.is_python_file_str(os.path.basename(full_path)):
             return {"error": f"Not a Python file: {file_path}"}
 
         # Check file size to prevent memory issues
-        try:
-            file_size = full_path.stat().st_size
-            if (
-                file_size > config.max_file_size * 2
-            ):  # Allow larger files for AST parsing
-                return {
-                    "error": f"File too large for AST parsing: {file_path} ({file_size} bytes)"
-                }
-        except (OSError, PermissionError) as e:
-            return {"error": f"Cannot access file: {file_path} - {str(e)}"}
+        if st.st_size > config.max_file_size * 2:  # Allow larger files for AST parsing
+            return {
+                "error": f"File too large for AST parsing: {file_path} ({st.st_size} bytes)"
+            }
 
-        # Try to read the file content
+        # Read and parse, reusing the tree if this version was parsed before
         try:
-            with open(full_path, "r", encoding="utf-8") as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding or error handling
-            try:
-                with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                return {
-                    "error": f"File contains non-UTF-8 characters, some content may be lost: {file_path}"
-                }
-            except Exception:
-                return {"error": f"Cannot decode file as text: {file_path}"}
+            return _parse_cached(full_path, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
         except PermissionError:
             return {"error": f"Permission denied reading file: {file_path}"}
-        except MemoryError:
-            return {"error": f"File too large to load into memory: {file_path}"}
         except OSError as e:
             return {"error": f"OS error reading file: {file_path} - {str(e)}"}
-
-        # Try to parse the AST
-        try:
-            return ast.parse(content)
         except SyntaxError as e:
+            if e.msg.startswith("(unicode error)"):
+                # Undecodable bytes without a matching coding cookie
+                return {
+                    "error": f"File contains non-UTF-8 characters, some content may be lost: {file_path}"
+                }
             return {
                 "error": f"Syntax error in {file_path} at line {e.lineno}: {str(e)}"
             }
@@ -81,25 +122,45 @@ def get_ast_from_file(file_path: str) -> Union[ast.AST, Dict[str, str]]:
 
 def extract_docstring(node: ast.AST) -> Optional[str]:
     """Extract docstring from an AST node."""
-    if (
-        isinstance(
-            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)
-        )
-        and node.body
-        and isinstance(node.body[0], ast.Expr)
-        and isinstance(node.body[0].value, ast.Constant)
-        and isinstance(node.body[0].value.value, str)
-    ):
-        return node.body[0].value.value
+    if type(node) not in _DOCSTRING_TYPES or not node.body:
+        return None
+    first = node.body[0]
+    if type(first) is not ast.Expr:
+        return None
+    value = first.value
+    if type(value) is ast.Constant and type(value.value) is str:
+        return value.value
     return None
 
 
+def _unparse(node: ast.AST) -> str:
+    """
+    Like ast.unparse, with shortcuts for the most common simple expressions.
+
+    Plain and dotted names and None/bool/int constants make up most
+    annotations, decorators and base classes; everything else goes through
+    ast.unparse once and is remembered on the node, so other tools asking
+    about the same cached tree reuse the text.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id
+    if node_type is ast.Attribute and type(node.value) in _NAME_TYPES:
+        return f"{_unparse(node.value)}.{node.attr}"
+    if node_type is ast.Constant and type(node.value) in _PLAIN_CONSTANT_TYPES:
+        return repr(node.value)
+    text = vars(node).get("_unparsed")
+    if text is None:
+        text = node._unparsed = ast.unparse(node)
+    return text
+
+
 def get_type_annotation(annotation: Optional[ast.expr]) -> Optional[str]:
     """Convert type annotation AST node to string."""
     if annotation is None:
         return None
     try:
-        return ast.unparse(annotation)
+        return _unparse(annotation)
     except Exception:
         return None
 
@@ -155,7 +216,7 @@ def extract_function_info(
             param_index = default_offset + i
             if param_index < len(params):
                 try:
-                    params[param_index]["default"] = ast.unparse(default)
+                    params[param_index]["default"] = _unparse(default)
                 except (ValueError, TypeError, AttributeError):
                     params[param_index]["default"] = "<complex default>"
 
@@ -167,7 +228,7 @@ def extract_function_info(
         "docstring": extract_docstring(node),
         "parameters": params,
         "return_type": get_type_annotation(node.returns),
-        "decorators": [ast.unparse(dec) for dec in node.decorator_list],
+        "decorators": [_unparse(dec) for dec in node.decorator_list],
         "line_number": node.lineno,
     }
 
@@ -218,7 +279,7 @@ def extract_class_info(node: ast.ClassDef) -> Dict[str, Any]:
     base_classes = []
     for base in node.bases:
         try:
-            base_classes.append(ast.unparse(base))
+            base_classes.append(_unparse(base))
         except (ValueError, TypeError, AttributeError):
             base_classes.append("<complex base>")
 
@@ -230,11 +291,76 @@ def extract_class_info(node: ast.ClassDef) -> Dict[str, Any]:
         "methods": methods,
         "properties": properties,
         "class_variables": class_variables,
-        "decorators": [ast.unparse(dec) for dec in node.decorator_list],
+        "decorators": [_unparse(dec) for dec in node.decorator_list],
         "line_number": node.lineno,
     }
 
 
+def extract_import_info(
+    node: Union[ast.Import, ast.ImportFrom],
+) -> List[Dict[str, Any]]:
+    """Extract one entry per imported name from an import statement."""
+    if isinstance(node, ast.Import):
+        return [
+            {
+                "type": "import",
+                "module": alias.name,
+                "alias": alias.asname,
+                "line_number": node.lineno,
+            }
+            for alias in node.names
+        ]
+
+    module_name = node.module or ""
+    return [
+        {
+            "type": "from_import",
+            "module": module_name,
+            "name": alias.name,
+            "alias": alias.asname,
+            "level": node.level,
+            "line_number": node.lineno,
+        }
+        for alias in node.names
+    ]
+
+
+_SCOPE_NODES = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Walk loops test type(node) against these: AST node classes are never
+# subclassed, and a set lookup is cheaper than isinstance() with a tuple
+_FUNCTION_TYPES = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+_IMPORT_TYPES = frozenset({ast.Import, ast.ImportFrom})
+
+
+def _walk_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """
+    Walk the tree like ast.walk, but without entering expressions.
+
+    Definitions, imports and assignments are statements, and no expression
+    contains a statement, so they come out in the same order as ast.walk
+    while most of the tree is never visited.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        todo.extend(
+            child
+            for child in ast.iter_child_nodes(node)
+            if not isinstance(child, ast.expr)
+        )
+        yield node
+
+
+def _build_parent_map(tree: ast.AST) -> Dict[ast.AST, ast.AST]:
+    """Map every statement-level node to its direct parent in a single walk."""
+    return {
+        child: parent
+        for parent in _walk_statements(tree)
+        for child in ast.iter_child_nodes(parent)
+    }
+
+
 def parse_module_ast(file_path: str) -> Dict[str, Any]:
     """Parse a Python module and extract all classes and functions."""
     ast_result = get_ast_from_file(file_path)
@@ -250,47 +376,20 @@ def parse_module_ast(file_path: str) -> Dict[str, Any]:
         "imports": [],
         "docstring": extract_docstring(tree),
     }
+    parents = _build_parent_map(tree)
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+    for node in _walk_statements(tree):
+        node_type = type(node)
+        if node_type in _FUNCTION_TYPES:
             # Only include top-level functions (not methods)
-            is_method = False
-            for parent in ast.walk(tree):
-                if isinstance(parent, ast.ClassDef) and hasattr(parent, "body"):
-                    parent_body = getattr(parent, "body", [])
-                    if isinstance(parent_body, list) and node in parent_body:
-                        is_method = True
-                        break
-            if not is_method:
+            if not isinstance(parents.get(node), ast.ClassDef):
                 result["functions"].append(extract_function_info(node))
 
-        elif isinstance(node, ast.ClassDef):
+        elif node_type is ast.ClassDef:
             result["classes"].append(extract_class_info(node))
 
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                result["imports"].append(
-                    {
-                        "type": "import",
-                        "module": alias.name,
-                        "alias": alias.asname,
-                        "line_number": node.lineno,
-                    }
-                )
-
-        elif isinstance(node, ast.ImportFrom):
-            module_name = node.module or ""
-            for alias in node.names:
-                result["imports"].append(
-                    {
-                        "type": "from_import",
-                        "module": module_name,
-                        "name": alias.name,
-                        "alias": alias.asname,
-                        "level": node.level,
-                        "line_number": node.lineno,
-                    }
-                )
+        elif node_type in _IMPORT_TYPES:
+            result["imports"].extend(extract_import_info(node))
 
     return result
 
@@ -304,11 +403,8 @@ def get_function_details(file_path: str, function_name: str) -> Dict[str, Any]:
 
     tree = ast_result
 
-    for node in ast.walk(tree):
-        if (
-            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-            and node.name == function_name
-        ):
+    for node in _walk_statements(tree):
+        if type(node) in _FUNCTION_TYPES and node.name == function_name:
             return extract_function_info(node)
 
     return {"error": f'Function "{function_name}" not found in {file_path}'}
@@ -323,8 +419,8 @@ def get_class_details(file_path: str, class_name: str) -> Dict[str, Any]:
 
     tree = ast_result
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef) and node.name == class_name:
+    for node in _walk_statements(tree):
+        if type(node) is ast.ClassDef and node.name == class_name:
             return extract_class_info(node)
 
     return {"error": f'Class "{class_name}" not found in {file_path}'}
@@ -340,31 +436,9 @@ def find_imports_in_file(file_path: str) -> Dict[str, Any]:
     tree = ast_result
     imports_list = []
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports_list.append(
-                    {
-                        "type": "import",
-                        "module": alias.name,
-                        "alias": alias.asname,
-                        "line_number": node.lineno,
-                    }
-                )
-
-        elif isinstance(node, ast.ImportFrom):
-            module_name = node.module or ""
-            for alias in node.names:
-                imports_list.append(
-                    {
-                        "type": "from_import",
-                        "module": module_name,
-                        "name": alias.name,
-                        "alias": alias.asname,
-                        "level": node.level,
-                        "line_number": node.lineno,
-                    }
-                )
+    for node in _walk_statements(tree):
+        if type(node) in _IMPORT_TYPES:
+            imports_list.extend(extract_import_info(node))
 
     return {
         "file_path": file_path,
@@ -387,9 +461,13 @@ def get_type_hints_from_file(file_path: str) -> Dict[str, Any]:
         "classes": [],
         "variables": [],
     }
+    parents = _build_parent_map(tree)
+    # Class entries by name, so methods don't rescan the list of classes
+    class_entries: Dict[str, Dict[str, Any]] = {}
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+    for node in _walk_statements(tree):
+        node_type = type(node)
+        if node_type in _FUNCTION_TYPES:
             func_types = {
                 "name": node.name,
                 "parameters": [],
@@ -404,39 +482,31 @@ def get_type_hints_from_file(file_path: str) -> Dict[str, Any]:
                 )
 
             # Check if this is a class method
-            parent_class = None
-            for parent in ast.walk(tree):
-                if isinstance(parent, ast.ClassDef) and node in getattr(
-                    parent, "body", []
-                ):
-                    parent_class = parent.name
-                    break
+            parent = parents.get(node)
+            parent_class = parent.name if isinstance(parent, ast.ClassDef) else None
 
             if parent_class:
                 # Add to class methods
-                class_entry = next(
-                    (c for c in type_hints["classes"] if c["name"] == parent_class),
-                    None,
-                )
+                class_entry = class_entries.get(parent_class)
                 if not class_entry:
                     class_entry = {
                         "name": parent_class,
                         "methods": [],
                         "class_variables": [],
                     }
+                    class_entries[parent_class] = class_entry
                     type_hints["classes"].append(class_entry)
                 class_entry["methods"].append(func_types)
             else:
                 # Add to top-level functions
                 type_hints["functions"].append(func_types)
 
-        elif isinstance(node, ast.ClassDef):
+        elif node_type is ast.ClassDef:
             # Ensure class exists in our list and add class variables
-            class_entry = next(
-                (c for c in type_hints["classes"] if c["name"] == node.name), None
-            )
+            class_entry = class_entries.get(node.name)
             if not class_entry:
                 class_entry = {"name": node.name, "methods": [], "class_variables": []}
+                class_entries[node.name] = class_entry
                 type_hints["classes"].append(class_entry)
 
             # Find class variables
@@ -464,22 +534,11 @@ def get_type_hints_from_file(file_path: str) -> Dict[str, Any]:
                                 }
                             )
 
-        elif isinstance(node, ast.AnnAssign):
+        elif node_type is ast.AnnAssign:
             # Module-level annotated variable (e.g., var: int = 42)
             if isinstance(node.target, ast.Name):
                 # Check if this is not inside a class or function
-                is_top_level = True
-                for parent in ast.walk(tree):
-                    if isinstance(
-                        parent, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
-                    ):
-                        if hasattr(parent, "body") and node in getattr(
-                            parent, "body", []
-                        ):
-                            is_top_level = False
-                            break
-
-                if is_top_level:
+                if not isinstance(parents.get(node), _SCOPE_NODES):
                     type_hints["variables"].append(
                         {
                             "name": node.target.id,
@@ -488,24 +547,12 @@ def get_type_hints_from_file(file_path: str) -> Dict[str, Any]:
                         }
                     )
 
-        elif isinstance(node, ast.Assign):
+        elif node_type is ast.Assign:
             # Module-level assignment (e.g., var = 42)
             for target in node.targets:
                 if isinstance(target, ast.Name):
                     # Check if this is not inside a class or function
-                    is_top_level = True
-                    for parent in ast.walk(tree):
-                        if isinstance(
-                            parent,
-                            (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef),
-                        ):
-                            if hasattr(parent, "body") and node in getattr(
-                                parent, "body", []
-                            ):
-                                is_top_level = False
-                                break
-
-                    if is_top_level:
+                    if not isinstance(parents.get(node), _SCOPE_NODES):
                         type_hints["variables"].append(
                             {
                                 "name": target.id,
@@ -5,13 +5,68 @@ This module provides functions for finding files, reading file contents,
 and getting directory structure information.
 """
 
+import fnmatch
+import functools
+import os
+import re
+import stat
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 # Import configuration
 from ..config import config
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# File name patterns find_test_files looks for
+TEST_PATTERNS = ("test_*.py", "*_test.py", "tests.py")
+
+# All of TEST_PATTERNS as one regex, so a name is matched in a single call
+_TEST_NAME_RE = re.compile("|".join(map(fnmatch.translate, TEST_PATTERNS)))
+
+
+@functools.lru_cache(maxsize=64)
+def _read_bytes_cached(path: str, mtime_ns: int, ctime_ns: int, size: int) -> bytes:
+    """Read a whole file in one call; the stat fields invalidate the entry."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_file_bytes(
+    path: Union[str, Path], st: Optional[os.stat_result] = None
+) -> bytes:
+    """
+    Read a file's bytes through a small cache shared by the file and AST tools.
+
+    Args:
+        path: Absolute path of the file to read
+        st: Result of a stat() the caller already made, to avoid a second one
+
+    Returns:
+        The file contents
+    """
+    if st is None:
+        st = os.stat(path)
+    if st.st_size > config.max_file_size * 2:
+        # Don't let a few huge files evict everything else
+        with open(path, "rb") as f:
+            return f.read()
+    # ctime also changes on chmod/chown, so revoked access is not served
+    return _read_bytes_cached(str(path), st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolved_root(project_root: Path) -> Path:
+    """Resolve the project root once instead of on every path check."""
+    return project_root.resolve()
+
 
 def _validate_safe_path(file_path: str) -> str:
     """
@@ -50,7 +105,7 @@ def _validate_safe_path(file_path: str) -> str:
 
         # Ensure the resolved path is within project root
         try:
-            resolved_path.relative_to(config.project_root.resolve())
+            resolved_path.relative_to(_resolved_root(config.project_root))
         except ValueError:
             raise ValueError(f"Path outside project directory: {file_path}")
 
@@ -62,8 +117,14 @@ def _validate_safe_path(file_path: str) -> str:
 
 def find_test_files(
     directory: Optional[Union[str, Path]] = None,
+    with_stats: bool = True,
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
-    """Find all test files in the project."""
+    """
+    Find all test files in the project.
+
+    With with_stats=False the records leave out size and modified, so no
+    file is stat()ed; use it when only the paths are needed.
+    """
     if directory is None:
         directory = config.project_root
     else:
@@ -82,30 +143,20 @@ def find_test_files(
                 # For relative paths, validate they don't escape project root
                 try:
                     resolved_dir = (config.project_root / directory).resolve()
-                    resolved_dir.relative_to(config.project_root.resolve())
+                    resolved_dir.relative_to(_resolved_root(config.project_root))
                     directory = config.project_root / directory
                 except ValueError:
                     return {"error": f"Directory outside project: {directory}"}
 
     test_files = []
-    test_patterns = ["test_*.py", "*_test.py", "tests.py"]
 
     try:
-        for pattern in test_patterns:
-            for path in directory.rglob(pattern):
-                if path.is_file() and not is_ignored_path(path):
-                    rel_path = get_relative_path(path)
-                    stat = path.stat()
-                    test_files.append(
-                        {
-                            "path": rel_path,
-                            "name": path.name,
-                            "size": stat.st_size,
-                            "directory": get_relative_path(path.parent),
-                            "modified": stat.st_mtime,
-                            "is_test": True,
-                        }
-                    )
+        if is_ignored_path(directory):
+            return test_files
+
+        for entry in _scandir_files(directory):
+            if _is_test_file_name(entry.name):
+                test_files.append(_file_info(entry, True, with_stats))
     except Exception as e:
         print(f"Error finding test files: {e}", file=sys.stderr)
 
@@ -125,10 +176,95 @@ def is_ignored_path(path: Path) -> bool:
     return config.is_ignored_path(path)
 
 
+def _is_ignored_name(name: str) -> bool:
+    """is_ignored_path for an entry whose parent directory is not ignored."""
+    return config.is_ignored_component(name) or name in config.ignore_files
+
+
+def _scandir_files(root: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    Yield DirEntry objects for every non-ignored file below root.
+
+    Ignored directories are pruned instead of walked, and the file type comes
+    from the cached DirEntry data rather than a stat() per path. Like
+    Path.rglob, symlinked directories are not followed and unreadable or
+    missing directories are skipped. The caller must check root itself with
+    is_ignored_path.
+    """
+    is_ignored_component = config.is_ignored_component
+    ignore_files = config.ignore_files
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            # Unreadable, or removed since it was listed
+            continue
+        for entry in entries:
+            name = entry.name
+            if is_ignored_component(name):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name not in ignore_files and entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+
+
+def _is_test_file_name(name: str) -> bool:
+    """Check a file name against the patterns find_test_files looks for."""
+    return _TEST_NAME_RE.match(name) is not None
+
+
+@functools.lru_cache(maxsize=8192)
+def _relative_dir(directory: str, project_root: Path) -> str:
+    """get_relative_path for a directory, shared by all files inside it."""
+    try:
+        return str(Path(directory).relative_to(project_root))
+    except ValueError:
+        return str(Path(directory))
+
+
+def _file_info(
+    entry: os.DirEntry, is_test: bool, with_stats: bool = True
+) -> Dict[str, Any]:
+    """Build the record the file finders return for one file."""
+    directory = _relative_dir(os.path.dirname(entry.path), config.project_root)
+    if directory == ".":
+        path = entry.name
+    else:
+        path = os.path.join(directory, entry.name)
+    if not with_stats:
+        return {
+            "path": path,
+            "name": entry.name,
+            "directory": directory,
+            "is_test": is_test,
+        }
+    st = entry.stat()
+    return {
+        "path": path,
+        "name": entry.name,
+        "size": st.st_size,
+        "directory": directory,
+        "modified": st.st_mtime,
+        "is_test": is_test,
+    }
+
+
 def find_python_files(
     directory: Optional[Union[str, Path]] = None,
+    with_stats: bool = True,
 ) -> Union[List[Dict[str, Any]], Dict[str, str]]:
-    """Find all Python files in the project."""
+    """
+    Find all Python files in the project.
+
+    With with_stats=False the records leave out size and modified, so no
+    file is stat()ed; use it when only the paths are needed.
+    """
     if directory is None:
         directory = config.project_root
     else:
@@ -147,7 +283,7 @@ def find_python_files(
                 # For relative paths, validate they don't escape project root
                 try:
                     resolved_dir = (config.project_root / directory).resolve()
-                    resolved_dir.relative_to(config.project_root.resolve())
+                    resolved_dir.relative_to(_resolved_root(config.project_root))
                     directory = config.project_root / directory
                 except ValueError:
                     return {"error": f"Directory outside project: {directory}"}
@@ -155,21 +291,15 @@ def find_python_files(
     python_files = []
 
     try:
-        for path in directory.rglob("*"):
-            if path.is_file() and config.is_python_file(path):
-                if not is_ignored_path(path):
-                    rel_path = get_relative_path(path)
-                    stat = path.stat()
-                    python_files.append(
-                        {
-                            "path": rel_path,
-                            "name": path.name,
-                            "size": stat.st_size,
-                            "directory": get_relative_path(path.parent),
-                            "modified": stat.st_mtime,
-                            "is_test": config.is_test_file(path),
-                        }
-                    )
+        if is_ignored_path(directory):
+            return python_files
+
+        for entry in _scandir_files(directory):
+            if config.is_python_file_str(entry.name):
+                path = Path(entry.path)
+                python_files.append(
+                    _file_info(entry, config.is_test_file(path), with_stats)
+                )
     except Exception as e:
         print(f"Error finding Python files: {e}", file=sys.stderr)
 
@@ -194,28 +324,46 @@ def read_file_content(file_path: str, max_size: int = None) -> Dict[str, Any]:
         if config.is_ignored_path(full_path):
             return {"error": f"File is ignored: {file_path}"}
 
-        # Check if file exists and is actually a file
-        if not full_path.exists():
+        # Check if file exists and is actually a file, with a single stat
+        try:
+            st = os.stat(full_path)
+        except (FileNotFoundError, NotADirectoryError):
             return {"error": f"File not found: {file_path}"}
 
-        if not full_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {"error": f"Path is not a file: {file_path}"}
 
-        file_size = full_path.stat().st_size
+        file_size = st.st_size
         truncated = file_size > max_size
 
-        with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-            if truncated:
+        if not truncated:
+            # Same result as a text-mode read: drop undecodable bytes and
+            # translate newlines
+            content = (
+                read_file_bytes(full_path, st)
+                .decode("utf-8", errors="ignore")
+                .replace("\r\n", "\n")
+                .replace("\r", "\n")
+            )
+        else:
+            with open(full_path, "rb") as f:
                 # Read only up to max_size
-                content = f.read(max_size)
-                # Try to end at a reasonable boundary
-                if len(content) == max_size:
-                    # Find the last newline to avoid cutting in the middle of a line
-                    last_newline = content.rfind("\n")
-                    if last_newline > max_size * 0.9:  # Only if we don't lose too much
-                        content = content[: last_newline + 1]
-            else:
-                content = f.read()
+                data = f.read(max_size)
+            # Try to end at a reasonable boundary
+            if len(data) == max_size:
+                # Find the last newline to avoid cutting in the middle of a
+                # line, but only if we don't lose too much
+                start = int(max_size * 0.9) + 1
+                last_newline = max(data.rfind(b"\n", start), data.rfind(b"\r", start))
+                if last_newline != -1:
+                    data = data[: last_newline + 1]
+            # Decode only the part we keep; a character cut in half at the
+            # end is dropped like any other undecodable bytes
+            content = (
+                data.decode("utf-8", errors="ignore")
+                .replace("\r\n", "\n")
+                .replace("\r", "\n")
+            )
 
         return {
             "path": file_path,
@@ -232,6 +380,99 @@ def read_file_content(file_path: str, max_size: int = None) -> Dict[str, Any]:
         return {"error": f"Error reading file: {str(e)}"}
 
 
+def _tree_node(
+    path: str, name: str, entry: Optional[os.DirEntry]
+) -> Optional[Dict[str, Any]]:
+    """
+    Describe one path for get_directory_structure, without its children.
+
+    Children come with a DirEntry whose type needs no extra stat. Returns
+    None for paths that disappeared or became inaccessible mid-walk.
+    """
+    try:
+        is_directory = entry.is_dir() if entry is not None else os.path.isdir(path)
+    except OSError:
+        return None
+
+    result = {
+        "name": name,
+        "type": "directory" if is_directory else "file",
+        "path": get_relative_path(Path(path)),
+    }
+    if is_directory:
+        return result
+
+    # Handle file metadata with error recovery
+    try:
+        st = entry.stat() if entry is not None else os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        # Deleted since it was listed, or a dangling symlink
+        return None
+    except OSError:
+        # File became inaccessible
+        result["size"] = 0
+        result["modified"] = 0
+        result["is_python"] = False
+        result["is_text"] = False
+        result["stat_failed"] = True
+    else:
+        result["size"] = st.st_size
+        result["modified"] = st.st_mtime
+        result["is_python"] = config.is_python_file_str(name)
+        result["is_text"] = config.is_text_file_str(name)
+    return result
+
+
+def _build_tree(root: str, name: str, max_depth: int) -> Optional[Dict[str, Any]]:
+    """
+    Build the nested tree for get_directory_structure below root.
+
+    Uses an explicit stack rather than recursion. Children are pushed in
+    reverse name order, so each parent's children list ends up sorted by
+    name. The caller has already ruled out an ignored root.
+    """
+    tree = _tree_node(root, name, None)
+    if tree is None or max_depth < 0:
+        return None
+
+    stack = [(root, tree, 0)]
+    while stack:
+        path, node, depth = stack.pop()
+        if node["type"] != "directory":
+            continue
+
+        children = []
+        try:
+            with os.scandir(path) as it:
+                child_entries = sorted(it, key=lambda e: e.name, reverse=True)
+        except PermissionError:
+            # No access to directory contents
+            node["access_denied"] = True
+            child_entries = []
+        except OSError:
+            # Directory became inaccessible or was deleted
+            node["inaccessible"] = True
+            child_entries = []
+        node["children"] = children
+
+        if depth >= max_depth:
+            continue
+        pending = []
+        for child in child_entries:
+            # Only the new component needs checking; the parent path is
+            # already known not to be ignored
+            if _is_ignored_name(child.name):
+                continue
+            child_node = _tree_node(child.path, child.name, child)
+            if child_node is not None:
+                pending.append((child.path, child_node, depth + 1))
+        # pending is in reverse name order; attach in name order
+        children.extend(item[1] for item in reversed(pending))
+        stack.extend(pending)
+
+    return tree
+
+
 def get_directory_structure(
     directory: Optional[Path] = None, max_depth: int = None
 ) -> Dict[str, Any]:
@@ -254,7 +495,7 @@ def get_directory_structure(
                 # For relative paths, validate they don't escape project root
                 try:
                     resolved_dir = (config.project_root / directory).resolve()
-                    resolved_dir.relative_to(config.project_root.resolve())
+                    resolved_dir.relative_to(_resolved_root(config.project_root))
                     directory = config.project_root / directory
                 except ValueError:
                     return {"error": f"Directory outside project: {directory}"}
@@ -287,92 +528,98 @@ def get_directory_structure(
             "error": f"Unexpected error accessing directory: {directory} - {str(e)}"
         }
 
-    def build_tree(path: Path, current_depth: int = 0) -> Dict[str, Any]:
-        if current_depth > max_depth or is_ignored_path(path):
-            return None
+    if is_ignored_path(directory):
+        return None
+    return _build_tree(str(directory), directory.name, max_depth)
 
-        # Check if path still exists (handle race conditions)
-        try:
-            if not path.exists():
-                return None
-        except (OSError, PermissionError):
-            # Path became inaccessible during traversal
-            return None
 
-        try:
-            # Determine type with race condition protection
-            is_directory = path.is_dir()
-            result = {
-                "name": path.name,
-                "type": "directory" if is_directory else "file",
-                "path": get_relative_path(path),
-            }
-
-            if is_directory:
-                children = []
-                try:
-                    # Use sorted() with error handling for race conditions
-                    child_paths = list(path.iterdir())
-                    for child in sorted(child_paths):
-                        if not is_ignored_path(child):
-                            child_tree = build_tree(child, current_depth + 1)
-                            if child_tree:
-                                children.append(child_tree)
-                except PermissionError:
-                    # No access to directory contents
-                    result["access_denied"] = True
-                except OSError:
-                    # Directory became inaccessible or was deleted
-                    result["inaccessible"] = True
-
-                result["children"] = children
-            else:
-                # Handle file metadata with error recovery
-                try:
-                    stat = path.stat()
-                    result["size"] = stat.st_size
-                    result["modified"] = stat.st_mtime
-                    result["is_python"] = config.is_python_file(path)
-                    result["is_text"] = config.is_text_file(path)
-                except (OSError, PermissionError):
-                    # File became inaccessible or was deleted
-                    result["size"] = 0
-                    result["modified"] = 0
-                    result["is_python"] = False
-                    result["is_text"] = False
-                    result["stat_failed"] = True
-
-        except (OSError, PermissionError):
-            # Path became completely inaccessible
-            return None
+def _count_lines(data: bytes) -> int:
+    """
+    Count lines the way a text-mode readlines() would, on the raw bytes.
 
-        return result
+    \n, \r\n and a lone \r each end a line, and a final line without a
+    terminator still counts. Undecodable bytes count as text.
+    """
+    lines = data.count(b"\n")
+    if b"\r" in data:
+        lines += data.count(b"\r") - data.count(b"\r\n")
+    if data and not data.endswith((b"\n", b"\r")):
+        lines += 1
+    return lines
+
+
+# pyproject.toml [project] keys reported by get_project_info
+_PYPROJECT_KEYS = {
+    "name": "package_name",
+    "description": "description",
+    "requires-python": "python_requirement",
+}
+
+
+def _scan_pyproject_lines(path: Path) -> Dict[str, Any]:
+    """Pick top-level `key = "value"` lines out of pyproject.toml."""
+    metadata = {}
+    with open(path, "r") as f:
+        for line in f:
+            field, sep, value = line.partition(" = ")
+            if sep and field in _PYPROJECT_KEYS:
+                metadata[_PYPROJECT_KEYS[field]] = value.strip().strip("\"'")
+    return metadata
+
+
+def _read_pyproject_metadata(path: Path) -> Dict[str, Any]:
+    """Read the [project] name, description and Python requirement."""
+    if tomllib is None:
+        # No TOML parser available
+        return _scan_pyproject_lines(path)
 
-    return build_tree(directory)
+    try:
+        with open(path, "rb") as f:
+            project = tomllib.load(f).get("project", {})
+    except tomllib.TOMLDecodeError:
+        # Malformed file: recover what the line scan can still find
+        return _scan_pyproject_lines(path)
+    return {
+        key: project[field]
+        for field, key in _PYPROJECT_KEYS.items()
+        if field in project
+    }
 
 
 def get_project_info() -> Dict[str, Any]:
     """Get comprehensive project information."""
     info = config.get_project_info()
 
-    # Count files by type
+    # Count files by type and collect the Python and test file lists in a
+    # single walk; the lists match what find_python_files/find_test_files return
     file_counts = {"python": 0, "test": 0, "doc": 0, "other": 0}
     total_size = 0
+    python_files = []
+    test_files = []
 
-    for path in config.project_root.rglob("*"):
-        if path.is_file() and not is_ignored_path(path):
-            size = path.stat().st_size
-            total_size += size
-
-            if config.is_python_file(path):
-                if config.is_test_file(path):
-                    file_counts["test"] += 1
+    try:
+        if not is_ignored_path(config.project_root):
+            for entry in _scandir_files(config.project_root):
+                name = entry.name
+                total_size += entry.stat().st_size
+
+                if config.is_python_file_str(name):
+                    path = Path(entry.path)
+                    is_test = config.is_test_file(path)
+                    file_counts["test" if is_test else "python"] += 1
+                    record = _file_info(entry, is_test)
+                    python_files.append(record)
+                    if _is_test_file_name(name):
+                        # Same file, so only is_test can differ
+                        test_files.append(
+                            record if is_test else dict(record, is_test=True)
+                        )
+                elif os.path.splitext(name)[1] in {".rst", ".md"}:
+                    file_counts["doc"] += 1
                 else:
-                    file_counts["python"] += 1
-            elif path.suffix in {".rst", ".md"}:
-                file_counts["doc"] += 1
-            else:
-                file_counts["other"] += 1
+                    file_counts["other"] += 1
+    except Exception as e:
+        print(f"Error scanning project files: {e}", file=sys.stderr)
 
     info["file_counts"] = file_counts
     info["total_size"] = total_size
@@ -389,19 +636,7 @@ def get_project_info() -> Dict[str, Any]:
     pyproject_path = config.project_root / "pyproject.toml"
     if pyproject_path.exists():
         try:
-            with open(pyproject_path, "r") as f:
-                content = f.read()
-                # Extract basic info from pyproject.toml
-                lines = content.splitlines()
-                for line in lines:
-                    if line.startswith("name = "):
-                        info["package_name"] = line.split("=")[1].strip().strip("\"'")
-                    elif line.startswith("description = "):
-                        info["description"] = line.split("=")[1].strip().strip("\"'")
-                    elif line.startswith("requires-python = "):
-                        info["python_requirement"] = (
-                            line.split("=")[1].strip().strip("\"'")
-                        )
+            info.update(_read_pyproject_metadata(pyproject_path))
         except Exception as e:
             print(f"Error reading pyproject.toml: {e}", file=sys.stderr)
 
@@ -426,9 +661,9 @@ def get_project_info() -> Dict[str, Any]:
 
     info["key_files"] = key_files
 
-    # Get file lists
-    info["python_files"] = find_python_files()
-    info["test_files"] = find_test_files()
+    # File lists, in the same order as the finders return them
+    info["python_files"] = sorted(python_files, key=lambda x: x["path"])
+    info["test_files"] = sorted(test_files, key=lambda x: x["path"])
 
     # Add total count to file_counts
     info["file_counts"]["total"] = sum(file_counts.values())
@@ -437,10 +672,8 @@ def get_project_info() -> Dict[str, Any]:
     total_lines = 0
     for file_info in info["python_files"]:
         try:
-            file_path = config.project_root / file_info["path"]
-            if file_path.exists():
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    total_lines += len(f.readlines())
+            with open(config.project_root / file_info["path"], "rb") as f:
+                total_lines += _count_lines(f.read())
         except Exception:
             pass  # Skip files that can't be read
 
@@ -6,22 +6,158 @@ identifying untested code, suggesting test cases, and parsing coverage informati
 """
 
 import ast
+import copy
+import multiprocessing
+import os
 import re
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Import configuration and other tools
+from .. import disk_cache
 from ..config import config
 from .ast_tools import (
     extract_class_info,
     extract_function_info,
     find_imports_in_file,
     get_ast_from_file,
+    has_cached_tree,
     parse_module_ast,
 )
 from .file_tools import find_test_files, get_relative_path, is_ignored_path
 
+# Parsing is CPU-bound and holds the GIL, so from this many files on it is
+# spread over worker processes
+PARALLEL_PARSE_MIN_FILES = 32
+PARALLEL_PARSE_MAX_WORKERS = 8
+
+
+# parse_module_ast results by absolute path, with the (mtime_ns, size) of the
+# file version they describe; least recently used first
+PARSED_MODULE_CACHE_SIZE = 1024
+_parsed_modules: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_parsed_modules_lock = threading.Lock()
+
+# Worker pool shared by all calls, created on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _parse_module_in_worker(settings: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+    """
+    Process pool entry point; applies the parent's config settings first.
+
+    Reads and writes the MCP_CACHE_DIR entries the server uses for
+    parse_module, so work done here is not repeated after a restart.
+    """
+    vars(config).update(settings)
+    full_path = os.path.abspath(config.project_root / file_path)
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return parse_module_ast(file_path)
+
+    module_info = disk_cache.load_result(full_path, "parse_module_ast", (), st)
+    if module_info is disk_cache.MISSING:
+        module_info = parse_module_ast(file_path)
+        if "error" not in module_info:
+            disk_cache.store_result(full_path, "parse_module_ast", (), st, module_info)
+    return module_info
+
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool, starting it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # spawn, because forking a process that runs threads can deadlock
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _parse_pool
+
+
+def _discard_parse_pool() -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown(wait=False, cancel_futures=True)
+            _parse_pool = None
+
+
+def _parse_modules(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Run parse_module_ast over several files, in parallel when it pays off.
+
+    Results are returned in the order of file_paths. Results of earlier calls
+    and MCP_CACHE_DIR entries are reused while the file is unchanged, and
+    files whose tree is already cached here are parsed in this process. Only
+    the rest is sent to workers, and only when there are enough of them, more
+    than one CPU, and the pool works.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(file_paths)
+    stats: List[Optional[Tuple[str, os.stat_result]]] = [None] * len(file_paths)
+    uncached = []
+
+    for i, file_path in enumerate(file_paths):
+        full_path = os.path.abspath(config.project_root / file_path)
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            # parse_module_ast below reports the error
+            continue
+        stats[i] = (full_path, st)
+
+        with _parsed_modules_lock:
+            entry = _parsed_modules.get(full_path)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            results[i] = entry[2]
+            continue
+
+        module_info = disk_cache.load_result(full_path, "parse_module_ast", (), st)
+        if module_info is not disk_cache.MISSING:
+            results[i] = module_info
+        elif not has_cached_tree(file_path):
+            uncached.append(i)
+
+    workers = min(os.cpu_count() or 1, PARALLEL_PARSE_MAX_WORKERS)
+    if len(uncached) >= PARALLEL_PARSE_MIN_FILES and workers > 1:
+        try:
+            # Spawned workers start from the environment defaults, so they are
+            # sent this process's config (CLI overrides, ignore rules, ...)
+            parsed = _get_parse_pool(workers).map(
+                _parse_module_in_worker,
+                repeat(dict(vars(config))),
+                [file_paths[i] for i in uncached],
+                chunksize=max(1, len(uncached) // (workers * 4)),
+            )
+            for i, module_info in zip(uncached, parsed):
+                results[i] = module_info
+        except (BrokenProcessPool, OSError) as e:
+            _discard_parse_pool()
+            print(f"Parallel parsing failed, parsing serially: {e}", file=sys.stderr)
+
+    for i, file_path in enumerate(file_paths):
+        if results[i] is None:
+            results[i] = parse_module_ast(file_path)
+        if stats[i] is not None and "error" not in results[i]:
+            full_path, st = stats[i]
+            with _parsed_modules_lock:
+                _parsed_modules[full_path] = (st.st_mtime_ns, st.st_size, results[i])
+                _parsed_modules.move_to_end(full_path)
+                if len(_parsed_modules) > PARSED_MODULE_CACHE_SIZE:
+                    _parsed_modules.popitem(last=False)
+
+    return results
+
 
 def _detect_framework_context(
     file_path: str,
@@ -147,7 +283,7 @@ def analyze_test_files(directory: Optional[str] = None) -> Dict[str, Any]:
     else:
         search_dir = None
 
-    test_files = find_test_files(search_dir)
+    test_files = find_test_files(search_dir, with_stats=False)
 
     # Handle error case from find_test_files
     if isinstance(test_files, dict) and "error" in test_files:
@@ -577,8 +713,7 @@ def find_untested_code(
         },
     }
 
-    for source_file in source_files:
-        module_info = parse_module_ast(source_file)
+    for source_file, module_info in zip(source_files, _parse_modules(source_files)):
         if "error" in module_info:
             continue
 
@@ -948,9 +1083,34 @@ def get_test_coverage_info(coverage_file: Optional[str] = None) -> Dict[str, Any
         }
 
     coverage_path = config.project_root / coverage_file
-    if not coverage_path.exists():
+    try:
+        st = coverage_path.stat()
+    except OSError:
         return {"error": f"Coverage file not found: {coverage_file}"}
 
+    # Reports only change when tests are rerun, so reuse the parse until then.
+    # Callers get their own copy, and failed parses (e.g. a report that is
+    # still being written) are retried on the next call.
+    key = (str(config.project_root), coverage_file, st.st_mtime_ns, st.st_size)
+    coverage_info = _coverage_cache.get(key)
+    if coverage_info is None:
+        coverage_info = _parse_coverage_file(config.project_root, coverage_file)
+        if "error" in coverage_info:
+            return coverage_info
+        _coverage_cache[key] = coverage_info
+        while len(_coverage_cache) > _COVERAGE_CACHE_SIZE:
+            _coverage_cache.pop(next(iter(_coverage_cache)))
+    return copy.deepcopy(coverage_info)
+
+
+# Parsed coverage reports, keyed by project root, report name and report stat
+_COVERAGE_CACHE_SIZE = 8
+_coverage_cache: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _parse_coverage_file(project_root: Path, coverage_file: str) -> Dict[str, Any]:
+    """Parse a coverage report."""
+    coverage_path = project_root / coverage_file
     coverage_info = {
         "coverage_file": coverage_file,
         "coverage_data": {},
@@ -10,6 +10,8 @@ from redis_test_mcp_tools.tools.test_tools import (
     get_test_patterns,
     suggest_test_cases,
 )
+from redis_test_mcp_tools.tools import test_tools
+from redis_test_mcp_tools.tools.ast_tools import clear_cache
 
 # Add the parent directory to the path to import modules
 import sys
@@ -366,6 +368,103 @@ class TestFindUntestedCode:
             assert "untested_classes" in result
             assert "untested_files" in result
 
+    def test_find_untested_code_parallel_matches_serial(self, temp_project_dir):
+        """Test that parsing in worker processes gives the same result"""
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            serial = find_untested_code("src", "tests")
+            clear_cache()
+            test_tools._parsed_modules.clear()
+
+            # Workers are fresh processes, so only the parent sees this patch
+            with (
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.PARALLEL_PARSE_MIN_FILES",
+                    1,
+                ),
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.os.cpu_count",
+                    return_value=2,
+                ),
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.parse_module_ast",
+                    side_effect=AssertionError("parsed in the parent process"),
+                ),
+            ):
+                parallel = find_untested_code("src", "tests")
+
+            assert parallel == serial
+
+    def test_find_untested_code_workers_use_parent_config(self, temp_project_dir):
+        """Test that config overrides reach the worker processes"""
+        with (
+            patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir),
+            patch("redis_test_mcp_tools.config.config.max_file_size", 1),
+        ):
+            serial = find_untested_code("src", "tests")
+            clear_cache()
+            test_tools._parsed_modules.clear()
+
+            with (
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.PARALLEL_PARSE_MIN_FILES",
+                    1,
+                ),
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.os.cpu_count",
+                    return_value=2,
+                ),
+            ):
+                parallel = find_untested_code("src", "tests")
+
+            assert parallel == serial
+
+    def test_find_untested_code_cached_files_stay_in_process(self, temp_project_dir):
+        """Test that files parsed before are not sent to worker processes"""
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            serial = find_untested_code("src", "tests")
+
+            with (
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.PARALLEL_PARSE_MIN_FILES",
+                    1,
+                ),
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.os.cpu_count",
+                    return_value=2,
+                ),
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools._get_parse_pool"
+                ) as mock_pool,
+            ):
+                assert find_untested_code("src", "tests") == serial
+                mock_pool.assert_not_called()
+
+    def test_find_untested_code_reuses_worker_results(self, temp_project_dir, tmp_path):
+        """Test that worker results are kept here and in the disk cache"""
+        cache_dir = tmp_path / "cache"
+        with (
+            patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir),
+            patch("redis_test_mcp_tools.config.config.cache_dir", cache_dir),
+            patch("redis_test_mcp_tools.tools.test_tools.PARALLEL_PARSE_MIN_FILES", 1),
+            patch("redis_test_mcp_tools.tools.test_tools.os.cpu_count", return_value=2),
+        ):
+            clear_cache()
+            test_tools._parsed_modules.clear()
+            first = find_untested_code("src", "tests")
+            assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+            with (
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools._get_parse_pool"
+                ) as mock_pool,
+                patch(
+                    "redis_test_mcp_tools.tools.test_tools.parse_module_ast",
+                    side_effect=AssertionError("parsed again"),
+                ),
+            ):
+                assert find_untested_code("src", "tests") == first
+                mock_pool.assert_not_called()
+
     def test_find_untested_code_summary(self, temp_project_dir):
         """Test analysis summary structure"""
         with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
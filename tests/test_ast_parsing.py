@@ -38,6 +38,33 @@ class TestGetASTFromFile:
             result = get_ast_from_file(temp_python_file.name)
             assert isinstance(result, ast.Module)
 
+    def test_tree_reused_until_file_changes(self, temp_project_dir):
+        """Test that an unchanged file is parsed only once"""
+        python_file = temp_project_dir / "cached.py"
+        python_file.write_text("x = 1\n")
+
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            first = get_ast_from_file("cached.py")
+            assert get_ast_from_file("cached.py") is first
+
+            python_file.write_text("x = 1\ny = 2\n")
+            changed = get_ast_from_file("cached.py")
+            assert changed is not first
+            assert len(changed.body) == 2
+
+    def test_source_encoding_declarations(self, temp_project_dir):
+        """Test that BOMs and coding cookies are honoured"""
+        (temp_project_dir / "bom.py").write_bytes(b"\xef\xbb\xbfx = 1\n")
+        (temp_project_dir / "latin.py").write_bytes(
+            b"# -*- coding: latin-1 -*-\nname = 'caf\xe9'\n"
+        )
+
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            assert isinstance(get_ast_from_file("bom.py"), ast.Module)
+            tree = get_ast_from_file("latin.py")
+            assert isinstance(tree, ast.Module)
+            assert tree.body[0].value.value == "caf\u00e9"
+
     def test_nonexistent_file(self):
         """Test handling of non-existent file"""
         with patch("redis_test_mcp_tools.config.config.project_root", Path("/tmp")):
@@ -206,6 +233,16 @@ class TestGetTypeAnnotation:
         result = get_type_annotation(None)
         assert result is None
 
+    def test_complex_annotation_unparsed_once(self):
+        """Test that a node's unparsed text is reused on later calls"""
+        tree = ast.parse("def f(x: Dict[str, int]): pass")
+        annotation = tree.body[0].args.args[0].annotation
+
+        with patch("ast.unparse", wraps=ast.unparse) as unparse:
+            assert get_type_annotation(annotation) == "Dict[str, int]"
+            assert get_type_annotation(annotation) == "Dict[str, int]"
+            assert unparse.call_count == 1
+
     def test_unparseable_annotation(self):
         """Test handling of unparseable annotations"""
         # Create a mock annotation that will fail to unparse
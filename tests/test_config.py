@@ -63,6 +63,28 @@ class TestMCPServerConfig:
         test_config = MCPServerConfig()
         assert test_config.debug is True
 
+    @patch.dict(os.environ, {}, clear=True)
+    def test_cache_settings_defaults(self):
+        """Test that the disk cache and start-up warming are off by default"""
+        test_config = MCPServerConfig()
+        assert test_config.cache_dir is None
+        assert test_config.warm_cache is False
+        assert test_config.pretty_json is False
+
+    @patch.dict(
+        os.environ, {"MCP_CACHE_DIR": "/tmp/mcp-cache", "MCP_WARM_CACHE": "on"}
+    )
+    def test_cache_settings_from_environment(self):
+        """Test cache settings from environment variables"""
+        test_config = MCPServerConfig()
+        assert test_config.cache_dir == Path("/tmp/mcp-cache")
+        assert test_config.warm_cache is True
+
+    @patch.dict(os.environ, {"MCP_PRETTY_JSON": "yes"})
+    def test_pretty_json_from_environment(self):
+        """Test that pretty-printed tool results can be enabled"""
+        assert MCPServerConfig().pretty_json is True
+
     @patch.dict(os.environ, {}, clear=True)  # Clear environment
     def test_debug_environment_variable_comprehensive(self):
         """Test debug flag parsing with comprehensive edge cases"""
@@ -159,6 +181,22 @@ class TestMCPServerConfig:
         path = Path("src/module.py")
         assert mock_config.is_ignored_path(path) is False
 
+    def test_is_ignored_path_matches_whole_components(self, mock_config):
+        """Test that ignored names only match whole path components"""
+        assert mock_config.is_ignored_path(Path("src/buildtools/module.py")) is False
+        assert mock_config.is_ignored_path(Path("src/mybuild/module.py")) is False
+        assert mock_config.is_ignored_path(Path("src/build/module.py")) is True
+        assert mock_config.is_ignored_path(Path("../src/./module.py")) is False
+        assert mock_config.is_ignored_path(Path("src/..hidden/module.py")) is True
+
+    def test_is_ignored_component(self, mock_config):
+        """Test single-component checks used when walking directories"""
+        assert mock_config.is_ignored_component("__pycache__") is True
+        assert mock_config.is_ignored_component(".hidden") is True
+        assert mock_config.is_ignored_component("..") is False
+        assert mock_config.is_ignored_component("src") is False
+        assert mock_config.is_ignored_component("") is False
+
     def test_is_ignored_path_normal_directory(self, mock_config):
         """Test that normal directories are not ignored"""
         path = Path("src/utils")
@@ -199,6 +237,41 @@ class TestMCPServerConfig:
         path = Path("image.png")
         assert mock_config.is_text_file(path) is False
 
+    def test_is_file_str_helpers_follow_path_suffix(self, mock_config):
+        """Test that the name-based helpers follow Path.suffix semantics"""
+        names = [
+            "module.py",
+            "stub.pyi",
+            "README.md",
+            "Makefile",
+            ".py",
+            "x.",
+            "a.b.py",
+        ]
+        for name in names:
+            suffix = Path(name).suffix
+            is_python = suffix in mock_config.python_extensions
+            is_text = is_python or suffix in mock_config.text_extensions
+            assert mock_config.is_python_file_str(name) is is_python, name
+            assert mock_config.is_text_file_str(name) is is_text, name
+
+    def test_is_test_file_in_tests_directory(self, mock_config):
+        """Test that Python files under test directories are test files"""
+        assert mock_config.is_test_file(Path("tests/helpers.py")) is True
+        assert mock_config.is_test_file(Path("pkg/test/conftest.py")) is True
+
+    def test_is_test_file_by_filename(self, mock_config):
+        """Test that test-style filenames are detected outside test directories"""
+        assert mock_config.is_test_file(Path("src/test_module.py")) is True
+        assert mock_config.is_test_file(Path("src/module_test.py")) is True
+        assert mock_config.is_test_file(Path("src/tests.py")) is True
+
+    def test_is_test_file_non_test_file(self, mock_config):
+        """Test that regular modules are not test files"""
+        assert mock_config.is_test_file(Path("src/testing_utils.py")) is False
+        assert mock_config.is_test_file(Path("testsuite/module.py")) is False
+        assert mock_config.is_test_file(Path("tests/README.md")) is False
+
     def test_get_project_info_structure(self, mock_config):
         """Test that get_project_info returns expected structure"""
         info = mock_config.get_project_info()
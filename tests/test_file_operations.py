@@ -52,6 +52,29 @@ class TestFindTestFiles:
             for file_info in result:
                 assert "tests" in file_info["path"]
 
+    def test_find_test_files_single_pass(self, temp_project_dir):
+        """Test that each test file is listed once and ignored dirs are skipped"""
+        (temp_project_dir / "tests" / "test_both_test.py").write_text("x = 1")
+        (temp_project_dir / "build").mkdir()
+        (temp_project_dir / "build" / "test_skipped.py").write_text("x = 1")
+
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            file_paths = [f["path"] for f in find_test_files()]
+
+            assert file_paths.count(str(Path("tests") / "test_both_test.py")) == 1
+            assert not any("test_skipped.py" in path for path in file_paths)
+            assert file_paths == sorted(file_paths)
+
+    def test_find_test_files_without_stats(self, temp_project_dir):
+        """Test that with_stats=False lists the same files without metadata"""
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            full = find_test_files()
+            with patch("os.DirEntry.stat", side_effect=AssertionError):
+                result = find_test_files(with_stats=False)
+
+            assert [f["path"] for f in result] == [f["path"] for f in full]
+            assert all("size" not in f and "modified" not in f for f in result)
+
     def test_find_test_files_empty_directory(self, temp_project_dir):
         """Test finding test files in empty directory"""
         empty_dir = temp_project_dir / "empty"
@@ -186,6 +209,21 @@ class TestFindPythonFiles:
             file_paths = [f["path"] for f in result]
             assert not any("__pycache__" in path for path in file_paths)
 
+    def test_find_python_files_skips_ignored_directories(self, temp_project_dir):
+        """Test that files below ignored and hidden directories are skipped"""
+        for name in ("build", ".hidden", "venv"):
+            (temp_project_dir / name / "pkg").mkdir(parents=True)
+            (temp_project_dir / name / "pkg" / "skipped.py").write_text("x = 1")
+        (temp_project_dir / "src" / "kept.pyi").write_text("x: int")
+
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            result = find_python_files()
+
+            file_paths = [f["path"] for f in result]
+            assert not any("skipped.py" in path for path in file_paths)
+            assert str(Path("src") / "kept.pyi") in file_paths
+            assert file_paths == sorted(file_paths)
+
     def test_find_python_files_empty_directory(self, temp_project_dir):
         """Test finding Python files in empty directory"""
         empty_dir = temp_project_dir / "empty"
@@ -229,6 +267,28 @@ class TestReadFileContent:
             assert result["is_text"] is True
             assert result["content"] == "# Test Project"
 
+    def test_read_file_normalizes_newlines(self, temp_project_dir):
+        """Test that CRLF and CR line endings read back as LF"""
+        (temp_project_dir / "crlf.txt").write_bytes(b"one\r\ntwo\rthree\n")
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            result = read_file_content("crlf.txt")
+
+            assert result["content"] == "one\ntwo\nthree\n"
+            assert result["lines"] == 3
+
+    def test_read_file_reuses_cached_bytes(self, temp_project_dir):
+        """Test that unchanged files are not reopened, changed files are"""
+        target = temp_project_dir / "cached.txt"
+        target.write_text("first")
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            assert read_file_content("cached.txt")["content"] == "first"
+
+            with patch("builtins.open", side_effect=AssertionError("reopened")):
+                assert read_file_content("cached.txt")["content"] == "first"
+
+            target.write_text("second, longer")
+            assert read_file_content("cached.txt")["content"] == "second, longer"
+
     def test_read_nonexistent_file(self, temp_project_dir):
         """Test reading a non-existent file"""
         with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
@@ -251,6 +311,17 @@ class TestReadFileContent:
             assert len(result["content"]) <= 100
             assert result["truncated"] is True
 
+    def test_read_file_truncates_at_line_boundary(self, temp_project_dir):
+        """Test that truncation ends on a whole line of multi-byte text"""
+        large_file = temp_project_dir / "large.py"
+        large_file.write_bytes("# é\r\n".encode("utf-8") * 100)
+
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            result = read_file_content("large.py", max_size=100)
+
+            assert result["truncated"] is True
+            assert result["content"] == "# é\n" * 16
+
     def test_read_file_ignored_file(self, temp_project_dir):
         """Test reading an ignored file"""
         with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
@@ -451,6 +522,40 @@ class TestGetProjectInfo:
             assert file_counts["test"] > 0
             assert file_counts["total"] >= file_counts["python"] + file_counts["test"]
 
+    def test_get_project_info_pyproject_metadata(self, temp_project_dir):
+        """Test that [project] metadata is read from pyproject.toml"""
+        (temp_project_dir / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nrequires-python = ">=3.10"\n'
+            '\n[tool.demo]\nname = "other"\n'
+        )
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            result = get_project_info()
+
+            assert result["package_name"] == "demo"
+            assert result["python_requirement"] == ">=3.10"
+
+    def test_get_project_info_malformed_pyproject(self, temp_project_dir):
+        """Test that metadata is still recovered from an invalid pyproject.toml"""
+        (temp_project_dir / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nrequires-python = ">=3.10"\nversion = \n'
+        )
+        with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
+            result = get_project_info()
+
+            assert result["package_name"] == "demo"
+            assert result["python_requirement"] == ">=3.10"
+
+    def test_get_project_info_total_lines_line_endings(self, tmp_path):
+        """Test that LF, CRLF, lone CR and unterminated lines are all counted"""
+        (tmp_path / "lf.py").write_bytes(b"a = 1\nb = 2\n")
+        (tmp_path / "crlf.py").write_bytes(b"a = 1\r\nb = 2\r\n")
+        (tmp_path / "cr.py").write_bytes(b"a = 1\rb = 2\r")
+        (tmp_path / "open.py").write_bytes(b"a = 1\nb = 2")
+        with patch("redis_test_mcp_tools.config.config.project_root", tmp_path):
+            result = get_project_info()
+
+            assert result["total_lines"] == 8
+
     def test_get_project_info_main_directories(self, temp_project_dir):
         """Test that main directories are correctly identified"""
         with patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir):
@@ -4,7 +4,10 @@ Comprehensive unit tests for MCP server tools and handlers in main.py
 """
 
 from redis_test_mcp_tools.server import handle_call_tool, handle_list_tools, server
+import redis_test_mcp_tools.server as server_module
 import json
+import os
+import pickle
 
 # Add the parent directory to the path to import modules
 import sys
@@ -484,6 +487,397 @@ class TestHandleCallTool:
             assert "error" in response_data
 
 
+@pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+class TestASTFileCache:
+    """Test the on-disk cache for AST tool results"""
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, temp_python_file):
+        """Test that nothing is cached when no cache directory is configured"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            result = await handle_call_tool(
+                "parse_module", {"file_path": temp_python_file.name}
+            )
+
+            assert "functions" in json.loads(result[0].text)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_and_invalidation(self, temp_python_file, tmp_path):
+        """Test that results are reused until the file changes"""
+        cache_dir = tmp_path / "cache"
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", cache_dir),
+        ):
+            args = {"file_path": temp_python_file.name}
+            first = await handle_call_tool("parse_module", args)
+            assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+            # A hit must come from the pickle, not from re-parsing the file
+            cache_file = next(cache_dir.glob("*.pkl"))
+            st = temp_python_file.stat()
+            cache_file.write_bytes(
+                pickle.dumps((st.st_mtime_ns, st.st_size, {"cached": True}))
+            )
+            server_module._memory_cache.clear()
+            second = await handle_call_tool("parse_module", args)
+            assert json.loads(second[0].text) == {"cached": True}
+            assert "functions" in json.loads(first[0].text)
+
+            temp_python_file.write_text("def changed():\n    pass\n")
+            third = await handle_call_tool("parse_module", args)
+            names = [f["name"] for f in json.loads(third[0].text)["functions"]]
+            assert names == ["changed"]
+            # The entry is rewritten in place rather than left behind
+            assert list(cache_dir.glob("*.pkl")) == [cache_file]
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_hit(self, temp_python_file):
+        """Test that repeat calls in a session are served from memory"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            args = {"file_path": temp_python_file.name}
+            await handle_call_tool("parse_module", args)
+
+            with patch(
+                "redis_test_mcp_tools.tools.ast_tools.get_ast_from_file"
+            ) as mock_get_ast:
+                result = await handle_call_tool("parse_module", args)
+                mock_get_ast.assert_not_called()
+            assert "functions" in json.loads(result[0].text)
+
+    @pytest.mark.asyncio
+    async def test_serialized_text_is_reused(self, temp_python_file):
+        """Test that a cached result is not serialized again"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            args = {"file_path": temp_python_file.name}
+            first = await handle_call_tool("parse_module", args)
+
+            with patch("redis_test_mcp_tools.server._safe_json_dumps") as mock_dumps:
+                second = await handle_call_tool("parse_module", args)
+                mock_dumps.assert_not_called()
+            assert second[0].text == first[0].text
+
+    @pytest.mark.asyncio
+    async def test_serialized_text_follows_pretty_json(self, temp_python_file):
+        """Test that memoized text is not reused across indentation settings"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            args = {"file_path": temp_python_file.name}
+            with patch("redis_test_mcp_tools.config.config.pretty_json", False):
+                compact = await handle_call_tool("parse_module", args)
+            with patch("redis_test_mcp_tools.config.config.pretty_json", True):
+                pretty = await handle_call_tool("parse_module", args)
+
+            assert "\n" not in compact[0].text
+            assert "\n  " in pretty[0].text
+
+    @pytest.mark.asyncio
+    async def test_uncached_results_not_memoized(self, temp_python_file):
+        """Test that results not served from the file cache skip the text cache"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            server_module._text_cache.clear()
+            await handle_call_tool(
+                "suggest_test_cases", {"file_path": temp_python_file.name}
+            )
+
+            assert not server_module._text_cache
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_populates_memory_cache(self, temp_python_file):
+        """Test that warming parses project files ahead of the first call"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            assert await server_module.warm_cache() > 0
+
+            with patch(
+                "redis_test_mcp_tools.tools.ast_tools.get_ast_from_file"
+            ) as mock_get_ast:
+                result = await handle_call_tool(
+                    "parse_module", {"file_path": temp_python_file.name}
+                )
+                mock_get_ast.assert_not_called()
+            assert "functions" in json.loads(result[0].text)
+
+    @pytest.mark.asyncio
+    async def test_detected_framework_not_cached(self, temp_python_file):
+        """Test that suggestions follow changes to the project's test files"""
+        with (
+            patch(
+                "redis_test_mcp_tools.config.config.project_root",
+                temp_python_file.parent,
+            ),
+            patch("redis_test_mcp_tools.config.config.cache_dir", None),
+        ):
+            args = {"file_path": temp_python_file.name}
+            await handle_call_tool("suggest_test_cases", args)
+
+            with patch(
+                "redis_test_mcp_tools.tools.test_tools.get_test_patterns",
+                return_value={"testing_frameworks": ["unittest"]},
+            ) as mock_patterns:
+                await handle_call_tool("suggest_test_cases", args)
+                mock_patterns.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_skips_errors(self, temp_project_dir, tmp_path):
+        """Test that error results are not written to the cache"""
+        cache_dir = tmp_path / "cache"
+        bad_file = temp_project_dir / "bad.py"
+        bad_file.write_text("def broken(:\n")
+        with (
+            patch("redis_test_mcp_tools.config.config.project_root", temp_project_dir),
+            patch("redis_test_mcp_tools.config.config.cache_dir", cache_dir),
+        ):
+            result = await handle_call_tool("parse_module", {"file_path": "bad.py"})
+
+            assert "error" in json.loads(result[0].text)
+            assert not list(cache_dir.glob("*.pkl"))
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+class TestInputValidation:
+    """Test argument validation against the precompiled tool schemas"""
+
+    async def _call(self, name, arguments):
+        handler = server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name=name, arguments=arguments),
+        )
+        return (await handler(request)).root
+
+    @pytest.mark.asyncio
+    async def test_every_tool_has_a_validator(self):
+        """Test that a validator is built for each listed tool"""
+        tools = await handle_list_tools()
+        assert set(server_module._VALIDATORS) == {tool.name for tool in tools}
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_are_rejected(self):
+        """Test that schema violations return an error result"""
+        result = await self._call("parse_module", {})
+
+        assert result.isError is True
+        assert "Input validation error" in result.content[0].text
+        assert "file_path" in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_valid_arguments_reach_the_tool(self, temp_python_file):
+        """Test that valid arguments are dispatched to the tool"""
+        with patch(
+            "redis_test_mcp_tools.config.config.project_root", temp_python_file.parent
+        ):
+            result = await self._call(
+                "parse_module", {"file_path": temp_python_file.name}
+            )
+
+            assert not result.isError
+            assert "functions" in json.loads(result.content[0].text)
+
+    @pytest.mark.asyncio
+    async def test_batch_operations_are_validated(self):
+        """Test that each batch operation is checked against its tool's schema"""
+        result = await handle_call_tool(
+            "batch_execute",
+            {"operations": [{"name": "read_file", "arguments": {"max_size": 10}}]},
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["failed"] == 1
+        assert "Input validation error" in response_data["results"][0]["error"]
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+class TestArgumentValidators:
+    """Test the per-argument validation helpers"""
+
+    @pytest.mark.parametrize(
+        "identifier", ["simple_function", "_private", "Class.method", "caf\u00e9"]
+    )
+    def test_validate_identifier_accepts(self, identifier):
+        """Test that valid (dotted) Python identifiers are accepted"""
+        assert server_module._validate_identifier(f" {identifier} ", "name") == (
+            identifier
+        )
+
+    @pytest.mark.parametrize(
+        "identifier", ["1abc", ".method", "Class.", "a..b", "a-b", "a b", "a.1b"]
+    )
+    def test_validate_identifier_rejects(self, identifier):
+        """Test that strings that are not Python identifiers are rejected"""
+        with pytest.raises(ValueError, match="valid Python identifier"):
+            server_module._validate_identifier(identifier, "name")
+
+    @pytest.mark.parametrize(
+        "file_path, expected",
+        [
+            ("module.py", "module.py"),
+            (" ./src/module.py ", os.path.join("src", "module.py")),
+            ("src/../module.py", "module.py"),
+            ("..data/module.py", os.path.join("..data", "module.py")),
+        ],
+    )
+    def test_validate_file_path_normalizes(self, file_path, expected):
+        """Test that paths inside the project come back normalized"""
+        assert server_module._validate_file_path(file_path) == expected
+
+    @pytest.mark.parametrize(
+        "file_path", ["..", "../module.py", "src/../../module.py", "/etc/passwd"]
+    )
+    def test_validate_file_path_rejects_escapes(self, file_path):
+        """Test that traversal out of the project and absolute paths fail"""
+        with pytest.raises(ValueError, match="path traversal or absolute"):
+            server_module._validate_file_path(file_path)
+
+    @pytest.mark.parametrize("value, expected", [(512, 512), ("512", 512), (2.0, 2)])
+    def test_validate_max_size_converts(self, value, expected):
+        """Test that ints pass through and other numeric types are converted"""
+        assert server_module._validate_max_size(value) == expected
+
+    @pytest.mark.parametrize(
+        "value, message",
+        [
+            ("invalid", "valid integer"),
+            (-1, "non-negative"),
+            (200 * 1024 * 1024, "too large"),
+        ],
+    )
+    def test_validate_max_size_rejects(self, value, message):
+        """Test that invalid or out-of-range sizes are rejected"""
+        with pytest.raises(ValueError, match=message):
+            server_module._validate_max_size(value)
+
+    @pytest.mark.parametrize(
+        "value, message", [([3], "valid integer"), (-1, "non-negative"), (21, "large")]
+    )
+    def test_validate_max_depth_rejects(self, value, message):
+        """Test that invalid or out-of-range depths are rejected"""
+        with pytest.raises(ValueError, match=message):
+            server_module._validate_max_depth(value)
+
+
+@pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+class TestBatchExecute:
+    """Test the batch_execute meta-tool"""
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_runs_operations_in_order(self, temp_python_file):
+        """Test that results are returned in the same order as the operations"""
+        with patch(
+            "redis_test_mcp_tools.config.config.project_root", temp_python_file.parent
+        ):
+            result = await handle_call_tool(
+                "batch_execute",
+                {
+                    "operations": [
+                        {
+                            "name": "parse_module",
+                            "arguments": {"file_path": temp_python_file.name},
+                        },
+                        {
+                            "name": "get_function_details",
+                            "arguments": {
+                                "file_path": temp_python_file.name,
+                                "function_name": "simple_function",
+                            },
+                        },
+                    ]
+                },
+            )
+
+            response_data = json.loads(result[0].text)
+            assert response_data["total"] == 2
+            assert response_data["succeeded"] == 2
+            names = [r["name"] for r in response_data["results"]]
+            assert names == ["parse_module", "get_function_details"]
+            assert response_data["results"][1]["result"]["name"] == "simple_function"
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_reports_errors_per_operation(self):
+        """Test that a failing operation does not fail the whole batch"""
+        result = await handle_call_tool(
+            "batch_execute",
+            {
+                "operations": [
+                    {"name": "unknown_tool"},
+                    {"name": "find_python_files", "arguments": {}},
+                ]
+            },
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["failed"] == 1
+        assert response_data["succeeded"] == 1
+        assert "Unknown tool" in response_data["results"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_stop_on_error(self):
+        """Test that stopOnError skips operations not yet started"""
+        result = await handle_call_tool(
+            "batch_execute",
+            {
+                "operations": [
+                    {"name": "unknown_tool"},
+                    {"name": "find_python_files"},
+                ],
+                "maxConcurrent": 1,
+                "stopOnError": True,
+            },
+        )
+
+        response_data = json.loads(result[0].text)
+        assert response_data["failed"] == 1
+        assert response_data["skipped"] == 1
+        assert response_data["results"][1] == {
+            "name": "find_python_files",
+            "skipped": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_execute_invalid_operations(self):
+        """Test that an empty operations list is rejected"""
+        result = await handle_call_tool("batch_execute", {"operations": []})
+
+        assert "operations must be a non-empty list" in result[0].text
+
+
 class TestServerToolsWithoutMCP:
     """Test server tools functionality without MCP dependency"""
 
@@ -617,6 +1011,48 @@ class TestServerToolsEdgeCases:
         # Nested sets should be converted to lists
         assert isinstance(response_data["file_info"]["extensions"], list)
 
+    @pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+    def test_safe_json_dumps_indentation(self):
+        """Test compact output by default and indented output on request"""
+        from redis_test_mcp_tools.server import _safe_json_dumps
+
+        data = {"a": [1, 2], "b": {"c": None}}
+        for module in (server_module.orjson, None):
+            with patch("redis_test_mcp_tools.server.orjson", module):
+                assert _safe_json_dumps(data) == '{"a":[1,2],"b":{"c":null}}'
+                pretty = _safe_json_dumps(data, indent=2)
+                assert pretty == json.dumps(data, indent=2)
+
+    @pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+    def test_safe_json_dumps_without_orjson(self):
+        """Test that serialization falls back to the stdlib without orjson"""
+        from redis_test_mcp_tools.server import _safe_json_dumps
+
+        data = {
+            "path": Path("/some/path"),
+            "big": 2**70,
+            1: "non-str key",
+            "tags": {"only"},
+            "text": "caf\u00e9",
+        }
+        for module in (server_module.orjson, None):
+            with patch("redis_test_mcp_tools.server.orjson", module):
+                result_json = _safe_json_dumps(data)
+                response_data = json.loads(result_json)
+                assert response_data["path"] == "/some/path"
+                assert response_data["big"] == 2**70
+                assert response_data["1"] == "non-str key"
+                assert response_data["tags"] == ["only"]
+                assert "caf\u00e9" in result_json
+
+        with patch("redis_test_mcp_tools.server.orjson", None):
+            response_data = json.loads(_safe_json_dumps({(1, 2): "tuple key"}))
+            assert "Serialization error" in response_data["error"]
+
+            huge = {(1, 2): list(range(100000)), "text": "x" * 10000}
+            response_data = json.loads(_safe_json_dumps(huge))
+            assert len(response_data["partial_data"]) <= 503
+
     @pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
     @pytest.mark.asyncio
     async def test_handle_call_tool_exception_handling(self):
@@ -635,6 +1071,18 @@ class TestServerToolsEdgeCases:
             response_text = result[0].text
             assert isinstance(response_text, str)
 
+    @pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
+    @pytest.mark.asyncio
+    async def test_handle_call_tool_error_traceback_in_debug(self):
+        """Test that debug mode appends the traceback to error messages"""
+        with patch("redis_test_mcp_tools.config.config.debug", True):
+            result = await handle_call_tool("unknown_tool", {})
+
+        response_text = result[0].text
+        assert response_text.startswith("Error executing unknown_tool: Unknown tool")
+        assert "Traceback:" in response_text
+        assert "ValueError: Unknown tool: unknown_tool" in response_text
+
     @pytest.mark.skipif(not HAS_MCP, reason="MCP not available for testing")
     @pytest.mark.asyncio
     async def test_handle_call_tool_with_none_arguments(self):
@@ -6,6 +6,7 @@ and helper functions with extensive coverage.
 """
 
 import ast
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -1193,6 +1194,52 @@ class TestGetTestCoverageInfo:
         assert "covered_lines" in summary
         assert "coverage_percentage" in summary
 
+    def test_get_test_coverage_info_reuses_parse_until_file_changes(
+        self, temp_project_dir
+    ):
+        """Test that an unchanged coverage report is not parsed again"""
+        coverage_xml = temp_project_dir / "coverage.xml"
+        line = '<line hits="{hits}" number="1"/>'
+        template = (
+            '<coverage><packages><package name="p"><classes>'
+            '<class filename="example.py" name="example.py"><lines>{line}</lines>'
+            "</class></classes></package></packages></coverage>"
+        )
+        coverage_xml.write_text(template.format(line=line.format(hits=0)))
+
+        with patch("redis_test_mcp_tools.tools.test_tools.config") as mock_config:
+            mock_config.project_root = temp_project_dir
+            first = get_test_coverage_info("coverage.xml")
+
+            with patch("xml.etree.ElementTree.parse") as mock_parse:
+                assert get_test_coverage_info("coverage.xml") == first
+                mock_parse.assert_not_called()
+
+            coverage_xml.write_text(template.format(line=line.format(hits=10)))
+            changed = get_test_coverage_info("coverage.xml")
+
+        assert first["summary"]["covered_lines"] == 0
+        assert changed["summary"]["covered_lines"] == 1
+
+    def test_get_test_coverage_info_cache_is_isolated(self, temp_project_dir):
+        """Test that callers get their own copy and failed parses are retried"""
+        coverage_xml = temp_project_dir / "coverage.xml"
+        coverage_xml.write_text("<coverage><packages>x")
+        os.utime(coverage_xml, ns=(0, 0))
+
+        with patch("redis_test_mcp_tools.tools.test_tools.config") as mock_config:
+            mock_config.project_root = temp_project_dir
+            assert "error" in get_test_coverage_info("coverage.xml")
+
+            # Same size, so only a retried parse can see the complete report
+            coverage_xml.write_text("<coverage></coverage>")
+            os.utime(coverage_xml, ns=(0, 0))
+            first = get_test_coverage_info("coverage.xml")
+            assert "error" not in first
+
+            first["coverage_gaps"].append("mutated")
+            assert get_test_coverage_info("coverage.xml")["coverage_gaps"] == []
+
     def test_get_test_coverage_info_binary_format(self, temp_project_dir):
         """Test parsing binary coverage format"""
         coverage_file = temp_project_dir / ".coverage"